@@ -3,6 +3,7 @@ from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from pymongo import MongoClient
 import os
+import threading
 from datetime import datetime
 
 def get_current_timestamp():
@@ -35,13 +36,27 @@ def create_app():
     # Add timestamp function to app context
     app.get_current_timestamp = get_current_timestamp
     
-    # Register blueprints
-    from app.routes import auth, jobs, resume, chat, salary
-    
-    app.register_blueprint(auth.bp)
-    app.register_blueprint(jobs.bp)
-    app.register_blueprint(resume.bp)
-    app.register_blueprint(chat.bp)
-    app.register_blueprint(salary.bp)
+    # Register blueprints, timing each import (heavy ML libraries load on first use)
+    from app.services.import_report import ImportTimer
+    import_timer = ImportTimer()
+    for name in ('auth', 'jobs', 'resume', 'chat', 'salary'):
+        module = import_timer.import_module(f'app.routes.{name}')
+        app.register_blueprint(module.bp)
+    
+    app.import_report = import_timer.report()
+    if os.environ.get('IMPORT_TIME_REPORT', '0') == '1':
+        import_timer.log_report()
+    
+    # Optionally load models in the background so the first request does not pay for them
+    preload = [name.strip() for name in os.environ.get('PRELOAD_MODELS', '').split(',') if name.strip()]
+    if preload:
+        from app.services.registry import registry
+        threading.Thread(target=registry.preload, args=(preload,), name='model-preload', daemon=True).start()
+    
+    # Keep popular searches warm so the first user of the day skips the cold fetch
+    if os.environ.get('CACHE_WARMING', '0') == '1':
+        from app.services.registry import registry
+        threading.Thread(target=lambda: registry.get('cache_warmer').start(),
+                         name='cache-warmer-start', daemon=True).start()
     
     return app
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Approximate Nearest-Neighbour Index
+Description: Inverted-file (IVF) cosine-similarity index over job embeddings, implemented with NumPy
+"""
+
+import logging
+import threading
+import numpy as np
+from typing import Hashable, List, Optional, Sequence, Tuple
+from app.ml_models.quantization import QuantizedVectors
+
+logger = logging.getLogger(__name__)
+
+class IVFIndex:
+    """Inverted-file ANN index over unit-normalised vectors
+
+    Vectors are partitioned into ``n_lists`` clusters by spherical k-means. A query scores
+    the centroids, then only the vectors in the ``n_probe`` closest clusters. Until the
+    index holds ``min_train_size`` vectors every search is exact. The clustering is
+    retrained whenever the index has grown by ``retrain_growth`` since the last training.
+    Vectors are stored as ``vector_dtype`` rows (float32, float16 or per-vector int8).
+    """
+
+    def __init__(self, dim: int = 384, n_lists: Optional[int] = None, n_probe: int = 8,
+                 min_train_size: int = 2048, retrain_growth: float = 2.0,
+                 kmeans_iterations: int = 10, seed: int = 42, vector_dtype: str = 'float32'):
+        self.dim = dim
+        self.vector_dtype = vector_dtype
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.min_train_size = min_train_size
+        self.retrain_growth = retrain_growth
+        self.kmeans_iterations = kmeans_iterations
+        self.rng = np.random.default_rng(seed)
+
+        self._vectors = QuantizedVectors(dim, vector_dtype)
+        self._alive = np.zeros(0, dtype=bool)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._keys: List[Optional[Hashable]] = []
+        self._rows = {}
+        self._size = 0
+
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-8)
+
+    def _reserve(self, extra: int):
+        """Grow the backing arrays geometrically so appends are amortised O(1)"""
+        needed = self._size + extra
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+
+        new_capacity = max(needed, capacity * 2, 1024)
+        self._vectors.resize(new_capacity)
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        assignments = np.zeros(new_capacity, dtype=np.int32)
+        assignments[:self._size] = self._assignments[:self._size]
+        self._alive, self._assignments = alive, assignments
+
+    def add(self, keys: Sequence[Hashable], vectors: np.ndarray):
+        """Insert or replace vectors by key"""
+        vectors = self._normalize(vectors).reshape(-1, self.dim)
+        if len(keys) != len(vectors):
+            raise ValueError("keys and vectors must have the same length")
+
+        with self._lock:
+            self.remove([key for key in keys if key in self._rows])
+
+            self._reserve(len(keys))
+            start = self._size
+            end = start + len(keys)
+            self._vectors[start:end] = vectors
+            self._alive[start:end] = True
+            for offset, key in enumerate(keys):
+                self._rows[key] = start + offset
+                self._keys.append(key)
+            self._size = end
+
+            if self._centroids is not None:
+                self._assignments[start:end] = self._assign(vectors)
+
+            if len(self._rows) >= self.min_train_size and (
+                self._centroids is None or len(self._rows) >= self._trained_size * self.retrain_growth
+            ):
+                self.train()
+
+    def get(self, keys: Sequence[Hashable]) -> Tuple[np.ndarray, np.ndarray]:
+        """Dequantised unit vectors of the keys present, and a boolean mask of which were"""
+        with self._lock:
+            found = np.array([key in self._rows for key in keys], dtype=bool)
+            rows = np.array([self._rows[key] for key in keys if key in self._rows], dtype=np.int64)
+            return self._vectors.decode(rows).reshape(-1, self.dim), found
+
+    def remove(self, keys: Sequence[Hashable]):
+        """Remove vectors by key; space is reclaimed on the next compaction"""
+        with self._lock:
+            for key in keys:
+                row = self._rows.pop(key, None)
+                if row is not None:
+                    self._alive[row] = False
+                    self._keys[row] = None
+
+            if self._size > 1024 and len(self._rows) < self._size // 2:
+                self._compact()
+
+    def _compact(self):
+        rows = np.flatnonzero(self._alive[:self._size])
+        keys = [self._keys[row] for row in rows]
+        self._vectors = self._vectors.take(rows)
+        self._assignments = self._assignments[rows].copy()
+        self._alive = np.ones(len(rows), dtype=bool)
+        self._keys = keys
+        self._rows = {key: row for row, key in enumerate(keys)}
+        self._size = len(rows)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def train(self):
+        """(Re)build the coarse clustering with spherical k-means over the live vectors"""
+        with self._lock:
+            rows = np.flatnonzero(self._alive[:self._size])
+            if len(rows) == 0:
+                return
+
+            vectors = self._vectors.decode(rows)
+            n_lists = self.n_lists or max(1, int(4 * np.sqrt(len(rows))))
+            n_lists = min(n_lists, len(rows))
+
+            # Train on a bounded sample; assignment of the rest is a single product
+            sample_size = min(len(rows), n_lists * 64)
+            sample = vectors[self.rng.choice(len(rows), size=sample_size, replace=False)]
+            centroids = sample[self.rng.choice(sample_size, size=n_lists, replace=False)].copy()
+
+            for _ in range(self.kmeans_iterations):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, labels, sample)
+                counts = np.bincount(labels, minlength=n_lists)
+                empty = counts == 0
+                # Re-seed empty clusters from random sample points
+                if empty.any():
+                    sums[empty] = sample[self.rng.choice(sample_size, size=int(empty.sum()))]
+                centroids = self._normalize(sums)
+
+            self._centroids = centroids
+            self._assignments[rows] = self._assign(vectors)
+            self._trained_size = len(rows)
+            logger.info(f"Trained IVF index: {len(rows)} vectors in {n_lists} lists")
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the stored vectors"""
+        return self._vectors.nbytes
+
+    def search(self, query: np.ndarray, k: int = 10,
+               n_probe: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """Return up to ``k`` (key, cosine similarity) pairs, best first"""
+        query = self._normalize(query).reshape(-1)
+
+        with self._lock:
+            if not self._rows:
+                return []
+
+            alive = self._alive[:self._size]
+            if self._centroids is not None:
+                n_probe = min(n_probe or self.n_probe, len(self._centroids))
+                centroid_scores = self._centroids @ query
+                probe = np.zeros(len(self._centroids), dtype=bool)
+                probe[np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]] = True
+                alive = alive & probe[self._assignments[:self._size]]
+
+            rows = np.flatnonzero(alive)
+            if len(rows) == 0:
+                return []
+
+            scores = self._vectors.dot(query, rows)
+            k = min(k, len(rows))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [(self._keys[rows[i]], float(scores[i])) for i in top]
@@ -0,0 +1,123 @@
+"""
+BM25 Inverted Index
+Description: Incremental lexical index over job titles and descriptions for cheap first-stage candidate retrieval
+"""
+
+import re
+import math
+import heapq
+import threading
+from collections import Counter, defaultdict
+from typing import Collection, Dict, Hashable, List, Optional, Sequence, Tuple
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+_STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in is it of on or our the to we will with you your '
+    'this that who what which job role work team years year experience'.split()
+)
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased terms, keeping tokens like 'c++', 'c#' and 'node.js' intact"""
+    return [token for token in _TOKEN_PATTERN.findall((text or '').lower()) if token not in _STOPWORDS]
+
+class BM25Index:
+    """Okapi BM25 over documents that can be added, replaced and removed by key
+
+    Postings map each term to ``{doc_id: term_frequency}``; a search only visits the
+    postings of the query's terms, so its cost depends on how common those terms are
+    rather than on the corpus size.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._doc_terms: Dict[int, Counter] = {}
+        self._doc_lengths: Dict[int, int] = {}
+        self._ids: Dict[Hashable, int] = {}
+        self._keys: Dict[int, Hashable] = {}
+        self._next_id = 0
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._ids
+
+    def add(self, keys: Sequence[Hashable], texts: Sequence[str]):
+        """Insert or replace documents by key"""
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in self._ids:
+                    self._remove_one(key)
+
+                terms = Counter(tokenize(text))
+                doc_id = self._next_id
+                self._next_id += 1
+
+                self._ids[key] = doc_id
+                self._keys[doc_id] = key
+                self._doc_terms[doc_id] = terms
+                length = sum(terms.values())
+                self._doc_lengths[doc_id] = length
+                self._total_length += length
+                for term, frequency in terms.items():
+                    self._postings[term][doc_id] = frequency
+
+    def remove(self, keys: Sequence[Hashable]):
+        with self._lock:
+            for key in keys:
+                if key in self._ids:
+                    self._remove_one(key)
+
+    def _remove_one(self, key: Hashable):
+        doc_id = self._ids.pop(key)
+        del self._keys[doc_id]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str, k: int = 10,
+               restrict_to: Optional[Collection[Hashable]] = None) -> List[Tuple[Hashable, float]]:
+        """Top-k ``(key, score)`` by BM25, optionally only among ``restrict_to`` keys"""
+        terms = set(tokenize(query))
+        with self._lock:
+            n_docs = len(self._ids)
+            if not terms or not n_docs:
+                return []
+
+            allowed = None
+            if restrict_to is not None:
+                allowed = {self._ids[key] for key in restrict_to if key in self._ids}
+                if not allowed:
+                    return []
+
+            avg_length = self._total_length / n_docs or 1.0
+            k1, b = self.k1, self.b
+            scores: Dict[int, float] = defaultdict(float)
+
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+
+                # Walk whichever side is smaller: the term's postings or the allowed docs
+                if allowed is not None and len(allowed) < len(postings):
+                    matches = ((doc_id, postings[doc_id]) for doc_id in allowed if doc_id in postings)
+                else:
+                    matches = postings.items()
+
+                for doc_id, frequency in matches:
+                    if allowed is not None and doc_id not in allowed:
+                        continue
+                    norm = k1 * (1 - b + b * self._doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] += idf * frequency * (k1 + 1) / (frequency + norm)
+
+            best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+            return [(self._keys[doc_id], score) for doc_id, score in best]
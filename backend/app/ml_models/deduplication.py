@@ -0,0 +1,149 @@
+"""
+Near-Duplicate Job Detection
+Description: MinHash signatures with LSH banding to spot the same posting returned by different providers
+"""
+
+import re
+import zlib
+import numpy as np
+from typing import Dict, List, Optional
+
+# Mersenne prime 2^31 - 1: (a * h + b) stays below 2^62, so uint64 arithmetic never overflows
+_PRIME = np.uint64((1 << 31) - 1)
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+class NearDuplicateIndex:
+    """Incremental MinHash/LSH index over job postings
+
+    Each job is reduced to word ``shingle_size``-grams of its title, company, location
+    and the opening words of its description. ``num_perm`` MinHash values are split into
+    ``bands``; two jobs sharing any band become candidates and are confirmed when their
+    estimated Jaccard similarity reaches ``threshold``. Every lookup touches a constant
+    number of buckets, so de-duplicating n jobs is O(n).
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 3,
+                 threshold: float = 0.6, description_words: int = 50, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.description_words = description_words
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+        self._buckets: Dict[tuple, int] = {}
+        self._signatures: List[np.ndarray] = []
+        self._jobs: List[Dict] = []
+        self.duplicates_found = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _tokens(self, job: Dict) -> List[str]:
+        title = (job.get('job_title') or '').lower()
+        company = (job.get('company') or '').lower()
+        location = (job.get('location') or '').lower()
+        description = (job.get('job_description') or '').lower()
+
+        tokens = _TOKEN_PATTERN.findall(f"{title} {company} {location}")
+        tokens.extend(_TOKEN_PATTERN.findall(description)[:self.description_words])
+        return tokens
+
+    def signature(self, job: Dict) -> np.ndarray:
+        """MinHash signature of a job's shingles"""
+        tokens = self._tokens(job)
+        size = self.shingle_size
+        if len(tokens) < size:
+            shingles = {' '.join(tokens)}
+        else:
+            shingles = {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+            dtype=np.uint64, count=len(shingles)
+        ) % _PRIME
+
+        # One row per shingle, one column per hash permutation
+        permuted = (np.outer(hashes, self._a) + self._b) % _PRIME
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[tuple]:
+        rows = self.rows_per_band
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(self.bands)]
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(first == second))
+
+    def find_or_add(self, job: Dict) -> Optional[Dict]:
+        """Return the previously added job this one duplicates, or register it and return None"""
+        signature = self.signature(job)
+        band_keys = self._band_keys(signature)
+
+        checked = set()
+        for key in band_keys:
+            candidate = self._buckets.get(key)
+            if candidate is None or candidate in checked:
+                continue
+            checked.add(candidate)
+            if self.similarity(signature, self._signatures[candidate]) >= self.threshold:
+                self.duplicates_found += 1
+                return self._jobs[candidate]
+
+        self._register(job, signature, band_keys)
+        return None
+
+    def add(self, job: Dict):
+        """Register a job without checking it against earlier ones (e.g. already de-duplicated)"""
+        signature = self.signature(job)
+        self._register(job, signature, self._band_keys(signature))
+
+    def _register(self, job: Dict, signature: np.ndarray, band_keys: List[tuple]):
+        position = len(self._jobs)
+        self._jobs.append(job)
+        self._signatures.append(signature)
+        for key in band_keys:
+            self._buckets.setdefault(key, position)
+
+def merge_duplicate(original: Dict, duplicate: Dict) -> Dict:
+    """Fold a duplicate posting's provider metadata and any missing fields into the original"""
+    sources = original.setdefault('sources', [original.get('source', '')])
+    if duplicate.get('source') not in sources:
+        sources.append(duplicate.get('source'))
+
+    # Same opening in another city: keep every city the posting was listed in
+    locations = original.setdefault('locations', [original.get('location', '')])
+    if duplicate.get('location') and duplicate.get('location') not in locations:
+        locations.append(duplicate.get('location'))
+
+    original.setdefault('duplicate_postings', []).append({
+        'source': duplicate.get('source', ''),
+        'job_id': duplicate.get('job_id', ''),
+        'job_url': duplicate.get('job_url', ''),
+        'location': duplicate.get('location', '')
+    })
+
+    for field in ('salary_min', 'salary_max', 'salary_range', 'contract_type', 'category', 'created_date'):
+        if not original.get(field) and duplicate.get(field):
+            original[field] = duplicate[field]
+
+    return original
+
+def deduplicate_jobs(jobs: List[Dict], **index_options) -> List[Dict]:
+    """Collapse near-duplicate jobs, keeping the first posting of each group"""
+    index = NearDuplicateIndex(**index_options)
+    unique_jobs = []
+    for job in jobs:
+        original = index.find_or_add(job)
+        if original is None:
+            unique_jobs.append(job)
+        else:
+            merge_duplicate(original, job)
+    return unique_jobs
@@ -0,0 +1,152 @@
+"""
+Embedding Micro-Batcher
+Description: Coalesces concurrent encode calls on a shared sentence-transformer model into one batched encode
+"""
+
+import os
+import time
+import queue
+import asyncio
+import logging
+import threading
+import concurrent.futures
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def _bucket(size: int) -> str:
+    """Power-of-two histogram bucket: '1', '2-3', '4-7', ..."""
+    low = 1 << (size.bit_length() - 1)
+    return str(low) if low == 1 else f"{low}-{2 * low - 1}"
+
+class EmbeddingBatcher:
+    """Single encode thread in front of a shared model
+
+    Callers (inference-pool threads, or coroutines through ``encode_async``) enqueue
+    their texts and wait on a future. The encode thread takes the first waiting request,
+    keeps collecting for up to ``max_wait_ms`` or until ``max_batch_size`` texts are
+    queued, encodes the de-duplicated texts in one ``model.encode`` call and hands each
+    caller its rows. With small inputs the per-call overhead then gets paid once per
+    batch instead of once per request.
+    """
+
+    def __init__(self, model, max_batch_size: Optional[int] = None, max_wait_ms: Optional[float] = None,
+                 encode_batch_size: int = 64, history: int = 1000):
+        self.model = model
+        self.max_batch_size = max_batch_size or int(os.getenv('EMBEDDING_BATCH_MAX_SIZE', 128))
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else float(os.getenv('EMBEDDING_BATCH_WAIT_MS', 5))) / 1000
+        self.encode_batch_size = encode_batch_size
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.batches = 0
+        self.texts_encoded = 0
+        self.encode_seconds = 0.0
+        self._batch_sizes: Counter = Counter()
+        self._requests_per_batch: Counter = Counter()
+        self._recent_sizes: deque = deque(maxlen=history)
+
+    def _ensure_thread(self) -> queue.Queue:
+        """Start the encode thread on first use (and again after fork, since threads do not survive it)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,),
+                                                name='embedding-batcher', daemon=True)
+                self._thread.start()
+            return self._queue
+
+    def submit(self, texts: List[str]) -> concurrent.futures.Future:
+        """Queue texts for the next batch; the future resolves to their (n, dim) float32 embeddings"""
+        future = concurrent.futures.Future()
+        if not texts:
+            future.set_result(np.zeros((0, 0), dtype=np.float32))
+            return future
+        self._ensure_thread().put((list(texts), future))
+        return future
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return self.submit(texts).result()
+
+    async def encode_async(self, texts: List[str]) -> np.ndarray:
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def _collect(self, pending: queue.Queue) -> List[Tuple[List[str], concurrent.futures.Future]]:
+        """Block for one request, then gather more until the wait or size limit is hit"""
+        batch = [pending.get()]
+        size = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def _run(self, pending: queue.Queue):
+        while True:
+            batch = self._collect(pending)
+            # Abandoned futures (cancelled callers) are skipped
+            batch = [(texts, future) for texts, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            unique = list(dict.fromkeys(text for texts, _ in batch for text in texts))
+            started = time.perf_counter()
+            try:
+                encoded = np.asarray(self.model.encode(
+                    unique,
+                    batch_size=self.encode_batch_size,
+                    convert_to_tensor=False,
+                    show_progress_bar=False
+                ), dtype=np.float32)
+            except Exception as e:
+                logger.error(f"Batched encode of {len(unique)} texts failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self._record(len(batch), len(unique), time.perf_counter() - started)
+            rows = {text: index for index, text in enumerate(unique)}
+            for texts, future in batch:
+                future.set_result(encoded[[rows[text] for text in texts]])
+
+    def _record(self, n_requests: int, n_texts: int, seconds: float):
+        with self._lock:
+            self.requests += n_requests
+            self.batches += 1
+            self.texts_encoded += n_texts
+            self.encode_seconds += seconds
+            self._batch_sizes[_bucket(n_texts)] += 1
+            self._requests_per_batch[_bucket(n_requests)] += 1
+            self._recent_sizes.append(n_texts)
+
+    def stats(self) -> Dict[str, Any]:
+        """Batch-size distribution: power-of-two histograms plus percentiles of recent batches"""
+        with self._lock:
+            recent = np.asarray(self._recent_sizes) if self._recent_sizes else np.zeros(1)
+            order = lambda histogram: dict(sorted(histogram.items(), key=lambda item: int(item[0].split('-')[0])))
+            return {
+                'requests': self.requests,
+                'batches': self.batches,
+                'texts_encoded': self.texts_encoded,
+                'avg_requests_per_batch': round(self.requests / self.batches, 2) if self.batches else 0.0,
+                'avg_batch_size': round(self.texts_encoded / self.batches, 2) if self.batches else 0.0,
+                'batch_size_p50': float(np.percentile(recent, 50)),
+                'batch_size_p95': float(np.percentile(recent, 95)),
+                'batch_size_histogram': order(self._batch_sizes),
+                'requests_per_batch_histogram': order(self._requests_per_batch),
+                'encode_seconds': round(self.encode_seconds, 3)
+            }
@@ -0,0 +1,201 @@
+"""
+Persistent Embedding Store
+Description: Append-only, memory-mapped float32 embedding matrix keyed by content hash,
+shared between worker processes without copying
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Handle optional dependencies
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
+
+class EmbeddingStore:
+    """On-disk embedding store: a raw float32 matrix file plus an append-only offsets index
+
+    Layout of ``directory``:
+        embeddings.f32  rows of ``dim`` float32 values, appended in order
+        offsets.idx     one ``<sha1 of text> <row>`` line per stored embedding
+        meta.json       embedding dimension, checked when the store is reopened
+
+    Appends are serialised across processes with an advisory file lock. Readers map the
+    matrix read-only and pick up rows appended by other workers on the next lookup miss.
+    """
+
+    MATRIX_FILE = 'embeddings.f32'
+    INDEX_FILE = 'offsets.idx'
+    META_FILE = 'meta.json'
+    LOCK_FILE = '.lock'
+
+    def __init__(self, directory: str, dim: int = 384):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self.row_bytes = dim * np.dtype(np.float32).itemsize
+
+        self.matrix_path = self.directory / self.MATRIX_FILE
+        self.index_path = self.directory / self.INDEX_FILE
+        self.lock_path = self.directory / self.LOCK_FILE
+
+        self._offsets: Dict[str, int] = {}
+        self._index_position = 0
+        self._matrix: Optional[np.memmap] = None
+        self._mapped_rows = 0
+        self._lock = threading.RLock()
+
+        self._check_meta()
+        self.refresh()
+
+    def _check_meta(self):
+        """Write or validate the store metadata"""
+        meta_path = self.directory / self.META_FILE
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if meta.get('dim') != self.dim:
+                raise ValueError(
+                    f"Embedding store at {self.directory} has dim {meta.get('dim')}, expected {self.dim}"
+                )
+        else:
+            meta_path.write_text(json.dumps({'dim': self.dim, 'dtype': 'float32'}))
+
+    @staticmethod
+    def content_key(text: str) -> str:
+        """Content hash used as the store key"""
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, text: str) -> bool:
+        return self.content_key(text) in self._offsets
+
+    def refresh(self):
+        """Pick up rows and index entries appended by this or other processes"""
+        with self._lock:
+            self._remap()
+            self._read_index()
+
+    def _remap(self):
+        """Map any rows added to the matrix file since the last mapping"""
+        try:
+            size = self.matrix_path.stat().st_size
+        except FileNotFoundError:
+            return
+
+        rows = size // self.row_bytes
+        if rows == self._mapped_rows:
+            return
+
+        self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode='r', shape=(rows, self.dim))
+        self._mapped_rows = rows
+
+    def _read_index(self):
+        """Read index lines appended since the last read"""
+        try:
+            with open(self.index_path, 'rb') as index_file:
+                index_file.seek(self._index_position)
+                data = index_file.read()
+        except FileNotFoundError:
+            return
+
+        # Only consume complete lines; a concurrent writer may be mid-line
+        end = data.rfind(b'\n')
+        if end < 0:
+            return
+
+        # Stop at the first row not mapped yet (appended after _remap) and re-read it next time
+        consumed = 0
+        for line in data[:end].split(b'\n'):
+            parts = line.split()
+            if len(parts) == 2:
+                row = int(parts[1])
+                if row >= self._mapped_rows:
+                    break
+                self._offsets[parts[0].decode('ascii')] = row
+            consumed += len(line) + 1
+
+        self._index_position += consumed
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Get a stored embedding (a read-only view into the mapped matrix)"""
+        row = self._offsets.get(self.content_key(text))
+        if row is None:
+            return None
+        return self._matrix[row]
+
+    def get_many(self, texts: List[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Look up many texts, refreshing once on a miss; returns (found, missing)"""
+        keys = [self.content_key(text) for text in texts]
+        if any(key not in self._offsets for key in keys):
+            self.refresh()
+
+        found = {}
+        missing = []
+        for text, key in zip(texts, keys):
+            row = self._offsets.get(key)
+            if row is None:
+                missing.append(text)
+            else:
+                found[text] = self._matrix[row]
+
+        return found, missing
+
+    def add_many(self, texts: List[str], embeddings: np.ndarray) -> int:
+        """Append embeddings for texts not already stored; returns the number of rows written"""
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        if len(texts) != len(embeddings):
+            raise ValueError("texts and embeddings must have the same length")
+
+        with self._lock, open(self.lock_path, 'a') as lock_file:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self.refresh()
+
+                new_rows = []
+                new_keys = {}
+                for text, embedding in zip(texts, embeddings):
+                    key = self.content_key(text)
+                    if key in self._offsets or key in new_keys:
+                        continue
+                    new_keys[key] = len(new_keys)
+                    new_rows.append(embedding)
+
+                if not new_rows:
+                    return 0
+
+                # Rows first, then index lines, so readers never see an offset past the data
+                with open(self.matrix_path, 'ab') as matrix_file:
+                    size = matrix_file.tell()
+                    if size % self.row_bytes:
+                        # Drop a torn row left behind by an interrupted writer
+                        size -= size % self.row_bytes
+                        matrix_file.truncate(size)
+                        matrix_file.seek(size)
+                    start_row = size // self.row_bytes
+                    matrix_file.write(np.ascontiguousarray(np.stack(new_rows)).tobytes())
+                    matrix_file.flush()
+                    os.fsync(matrix_file.fileno())
+
+                with open(self.index_path, 'ab') as index_file:
+                    lines = ''.join(f"{key} {start_row + i}\n" for i, key in enumerate(new_keys))
+                    index_file.write(lines.encode('ascii'))
+
+                self.refresh()
+                return len(new_rows)
+
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -10,23 +10,40 @@ import pandas as pd
 import numpy as np
 import aiohttp
 import asyncio
-from sentence_transformers import SentenceTransformer, util
-from datetime import datetime, timedelta
+import atexit
+import concurrent.futures
+import heapq
+import re
+import random
+from datetime import timedelta
 import json
 import time
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-import nest_asyncio
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
+from app.ml_models.embedding_store import EmbeddingStore
+from app.ml_models.embedding_batcher import EmbeddingBatcher
+from app.ml_models.ann_index import IVFIndex
+from app.ml_models.bm25_index import BM25Index
+from app.ml_models.skill_taxonomy import skill_taxonomy
+from app.ml_models.quantization import recall_at_k
+from app.ml_models.deduplication import NearDuplicateIndex, merge_duplicate
+from app.ml_models.job_stats import JobStatistics
+from app.services.rate_limiter import TokenBucket
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.cassette import REDACTED, Cassette, CassetteMiss, CassetteSession, get_cassette
+from app.services.event_loop import BackgroundEventLoop, get_background_loop
+from app.services.inference_pool import InferencePool, get_inference_pool
+from app.services.cache import BoundedCache
+from app.services.single_flight import SingleFlight
+from app.services.cache_warmer import QueryLog
+from app.services.job_store import JobStore
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 
-# Apply nest_asyncio for better async handling in Jupyter environments
-nest_asyncio.apply()
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,7 +51,11 @@ logger = logging.getLogger(__name__)
 class JobAPIClient:
     """Async client for fetching real-time job data from various APIs"""
     
-    def __init__(self, api_keys: Dict[str, str] = None):
+    # Cancel message for requests abandoned as too slow (fetch deadline, losing hedge);
+    # the circuit breaker counts those as timeouts
+    ABANDONED = 'provider request abandoned as too slow'
+    
+    def __init__(self, api_keys: Dict[str, str] = None, rate_limits: Dict[str, Tuple[float, float]] = None):
         # Load API keys from environment variables if not provided
         if api_keys is None:
             api_keys = {
@@ -50,35 +71,241 @@ class JobAPIClient:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
-        self.request_delay = 0.5  # Reduced delay for async calls
         self.timeout = aiohttp.ClientTimeout(total=20)
+        
+        # Provider endpoints; override to point at a local stand-in (see benchmarks/provider_stub.py)
+        self.base_urls = {
+            'adzuna': os.getenv('ADZUNA_API_URL', 'https://api.adzuna.com/v1/api/jobs'),
+            'jsearch': os.getenv('JSEARCH_API_URL', 'https://jsearch.p.rapidapi.com'),
+            'jooble': os.getenv('JOOBLE_API_URL', 'https://jooble.org/api')
+        }
+        
+        # Per-provider quotas as (requests per second, burst size)
+        if rate_limits is None:
+            rate_limits = {
+                'adzuna': (float(os.getenv('ADZUNA_RATE_PER_SEC', 2)), float(os.getenv('ADZUNA_RATE_BURST', 5))),
+                'jsearch': (float(os.getenv('JSEARCH_RATE_PER_SEC', 2)), float(os.getenv('JSEARCH_RATE_BURST', 5))),
+                'jooble': (float(os.getenv('JOOBLE_RATE_PER_SEC', 2)), float(os.getenv('JOOBLE_RATE_BURST', 5)))
+            }
+        self.rate_limiters = {
+            provider: TokenBucket(rate, burst) for provider, (rate, burst) in rate_limits.items()
+        }
+        
+        # Stop calling a failing provider for a while instead of waiting out its timeouts
+        self.circuit_breakers = {
+            provider: CircuitBreaker(
+                provider,
+                failure_rate_threshold=float(os.getenv('JOB_API_BREAKER_FAILURE_RATE', 0.5)),
+                window_size=int(os.getenv('JOB_API_BREAKER_WINDOW', 20)),
+                min_calls=int(os.getenv('JOB_API_BREAKER_MIN_CALLS', 5)),
+                reset_timeout=float(os.getenv('JOB_API_BREAKER_RESET_SECONDS', 30))
+            )
+            for provider in self.rate_limiters
+        }
+        
+        # Retries for 429/5xx responses: exponential backoff with full jitter
+        self.max_retries = int(os.getenv('JOB_API_MAX_RETRIES', 2))
+        self.backoff_base = float(os.getenv('JOB_API_BACKOFF_BASE_SECONDS', 0.5))
+        self.backoff_max = float(os.getenv('JOB_API_BACKOFF_MAX_SECONDS', 8))
+        
+        # How many result pages stream_jobs_async requests from each provider
+        self.page_depth = int(os.getenv('JOB_API_PAGE_DEPTH', 3))
+        
+        # Latency budget for one multi-provider fetch; 0 waits for every provider
+        self.fetch_deadline = float(os.getenv('JOB_FETCH_DEADLINE_SECONDS', 8))
+        # Send a second identical request to a provider still silent after this long; 0 disables
+        self.hedge_after = float(os.getenv('JOB_FETCH_HEDGE_SECONDS', 0))
+        self.hedged_requests = 0
+        
+        # Long-lived pooled session, created lazily on the loop that first uses it
+        self.connection_limit = int(os.getenv('JOB_API_CONNECTION_LIMIT', 100))
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+        
+        # Record provider responses to, or replay them from, disk (PROVIDER_CASSETTE)
+        self.cassette: Optional[Cassette] = None
+        self.use_cassette(get_cassette())
+    
+    def use_cassette(self, cassette: Optional[Cassette]):
+        """Route provider requests through a record/replay cassette (None for live traffic)
+        
+        Takes effect for sessions created afterwards, so call it before the first request.
+        """
+        self.cassette = cassette
+        if cassette is not None:
+            # Jooble puts its key in the URL path, so redact by value as well as by name
+            cassette.add_secrets(self.api_keys.values())
+    
+    def _credential(self, name: str) -> Optional[str]:
+        """API key by name; replaying a cassette needs none, so the redacted value stands in"""
+        value = self.api_keys.get(name)
+        if not value and self.cassette is not None and self.cassette.mode == Cassette.REPLAY:
+            return REDACTED
+        return value
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive session with DNS caching, recreated if its event loop changed"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                await self._close_stale_session(self._session, self._session_loop)
+            if self.cassette is not None and self.cassette.mode == Cassette.REPLAY:
+                # Replay never touches the network
+                self._session = CassetteSession(self.cassette)
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+                self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+                if self.cassette is not None:
+                    self._session = CassetteSession(self.cassette, self._session)
+            self._session_loop = loop
+        return self._session
     
-    async def _make_async_request(self, session, url, method='GET', params=None, json_data=None, headers=None):
-        """Generic async request method"""
+    @staticmethod
+    async def _close_stale_session(session, session_loop):
+        """Close a session left behind on another event loop, on that loop if it still runs"""
         try:
-            if method.upper() == 'GET':
-                async with session.get(url, params=params, headers=headers, timeout=self.timeout) as response:
-                    response.raise_for_status()
-                    return await response.json()
-            elif method.upper() == 'POST':
-                async with session.post(url, json=json_data, headers=headers, timeout=self.timeout) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            if session_loop is not None and session_loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            else:
+                await session.close()
+        except Exception as e:
+            logger.warning(f"Error closing stale job API session: {e}")
+    
+    async def close(self):
+        """Close the pooled session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def _throttle(self, provider: str):
+        """Wait only if the provider's quota would otherwise be exceeded"""
+        limiter = self.rate_limiters.get(provider)
+        if limiter is not None:
+            waited = await limiter.acquire()
+            if waited:
+                logger.info(f"Rate limited {provider} request for {waited:.2f}s")
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential backoff, never shorter than the server's Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+    
+    @staticmethod
+    def _retry_after(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+    
+    async def _make_async_request(self, session, url, method='GET', params=None, json_data=None, headers=None,
+                                  provider: Optional[str] = None):
+        """Generic async request method
+        
+        With ``provider``, the call is throttled by that provider's quota and guarded by
+        its circuit breaker: while the circuit is open it returns None straight away.
+        429 and 5xx responses are retried with backoff; timeouts and connection errors
+        count as failures without a retry, as does a sent request cancelled with
+        ``ABANDONED``.
+        """
+        breaker = self.circuit_breakers.get(provider)
+        if breaker is not None and not breaker.allow_request():
+            logger.debug(f"Circuit open for {provider}; skipping request")
+            return None
+        
+        # A half-open probe gets a single attempt
+        max_retries = 0 if breaker is not None and breaker.state == CircuitBreaker.HALF_OPEN else self.max_retries
+        
+        error = None
+        sent = False
+        try:
+            for attempt in range(max_retries + 1):
+                if provider is not None:
+                    await self._throttle(provider)
+                
+                sent = True
+                try:
+                    if method.upper() == 'GET':
+                        request = session.get(url, params=params, headers=headers, timeout=self.timeout)
+                    elif method.upper() == 'POST':
+                        request = session.post(url, json=json_data, headers=headers, timeout=self.timeout)
+                    else:
+                        return None
+                    
+                    async with request as response:
+                        if response.status == 429 or response.status >= 500:
+                            error = f"HTTP {response.status} from {url}"
+                            retry_after = self._retry_after(response.headers.get('Retry-After'))
+                        else:
+                            response.raise_for_status()
+                            data = await response.json()
+                            if breaker is not None:
+                                breaker.record_success()
+                            return data
+                
+                except aiohttp.ClientResponseError as e:
+                    # Other 4xx: the provider is up but rejected this request
+                    logger.error(f"Async request error: {e}")
+                    if breaker is not None:
+                        breaker.record_success()
+                    return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = str(e) or type(e).__name__
+                    break
+                
+                if attempt < max_retries:
+                    delay = self._backoff_delay(attempt, retry_after)
+                    logger.warning(f"{error}; retry {attempt + 1}/{max_retries} in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+            
+            logger.error(f"Async request error: {error}")
+            if breaker is not None:
+                breaker.record_failure()
+            return None
+            
+        except asyncio.CancelledError as e:
+            if breaker is not None:
+                if sent and e.args and e.args[0] == self.ABANDONED:
+                    logger.warning(f"{provider} request abandoned at the deadline; counting a timeout")
+                    breaker.record_failure()
+                else:
+                    # Cancelled from outside (or still queued): no verdict on the provider
+                    breaker.release()
+            raise
+        except CassetteMiss as e:
+            # A gap in the recording says nothing about the provider's health
+            logger.warning(f"Cassette miss for {provider}: {e}")
+            if breaker is not None:
+                breaker.release()
+            return None
         except Exception as e:
             logger.error(f"Async request error: {e}")
+            if breaker is not None:
+                breaker.record_failure()
             return None
     
+    def get_provider_health(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit breaker state per provider"""
+        return {provider: breaker.stats() for provider, breaker in self.circuit_breakers.items()}
+    
     async def fetch_jobs_adzuna(self, keywords: str, location: str, country: str = 'in', 
-                               results_per_page: int = 50) -> List[Dict]:
+                               results_per_page: int = 50, page: int = 1) -> List[Dict]:
         """Fetch jobs from Adzuna API asynchronously"""
-        app_id = self.api_keys.get('adzuna_app_id')
-        app_key = self.api_keys.get('adzuna_app_key')
+        app_id = self._credential('adzuna_app_id')
+        app_key = self._credential('adzuna_app_key')
         
         if not app_id or not app_key:
             logger.warning("Adzuna API credentials not provided")
             return []
             
-        url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
+        url = f"{self.base_urls['adzuna']}/{country}/search/{page}"
         params = {
             'app_id': app_id,
             'app_key': app_key,
@@ -89,56 +316,56 @@ class JobAPIClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                await asyncio.sleep(self.request_delay)
-                data = await self._make_async_request(session, url, params=params, headers=self.headers)
-                
-                if not data:
-                    return []
-                
-                jobs = []
-                for job in data.get('results', []):
-                    salary_min = job.get('salary_min')
-                    salary_max = job.get('salary_max')
-                    salary_range = None
-                    
-                    if salary_min and salary_max:
-                        salary_range = f"₹{salary_min:,.0f} - ₹{salary_max:,.0f}"
-                    elif salary_min:
-                        salary_range = f"₹{salary_min:,.0f}+"
-                    
-                    jobs.append({
-                        'job_id': job.get('id', ''),
-                        'job_title': job.get('title', ''),
-                        'company': job.get('company', {}).get('display_name', ''),
-                        'location': job.get('location', {}).get('display_name', ''),
-                        'job_description': job.get('description', ''),
-                        'salary_min': salary_min,
-                        'salary_max': salary_max,
-                        'salary_range': salary_range,
-                        'job_url': job.get('redirect_url', ''),
-                        'created_date': job.get('created', ''),
-                        'contract_type': job.get('contract_type', ''),
-                        'category': job.get('category', {}).get('label', ''),
-                        'source': 'adzuna'
-                    })
+            session = await self._get_session()
+            data = await self._make_async_request(session, url, params=params, headers=self.headers,
+                                                  provider='adzuna')
+            
+            if not data:
+                return []
+            
+            jobs = []
+            for job in data.get('results', []):
+                salary_min = job.get('salary_min')
+                salary_max = job.get('salary_max')
+                salary_range = None
                 
-                logger.info(f"Fetched {len(jobs)} jobs from Adzuna")
-                return jobs
+                if salary_min and salary_max:
+                    salary_range = f"₹{salary_min:,.0f} - ₹{salary_max:,.0f}"
+                elif salary_min:
+                    salary_range = f"₹{salary_min:,.0f}+"
                 
+                jobs.append({
+                    'job_id': job.get('id', ''),
+                    'job_title': job.get('title', ''),
+                    'company': job.get('company', {}).get('display_name', ''),
+                    'location': job.get('location', {}).get('display_name', ''),
+                    'job_description': job.get('description', ''),
+                    'salary_min': salary_min,
+                    'salary_max': salary_max,
+                    'salary_range': salary_range,
+                    'job_url': job.get('redirect_url', ''),
+                    'created_date': job.get('created', ''),
+                    'contract_type': job.get('contract_type', ''),
+                    'category': job.get('category', {}).get('label', ''),
+                    'source': 'adzuna'
+                })
+            
+            logger.info(f"Fetched {len(jobs)} jobs from Adzuna")
+            return jobs
+            
         except Exception as e:
             logger.error(f"Error in Adzuna async fetch: {e}")
             return []
     
-    async def fetch_jobs_jsearch(self, keywords: str, location: str, limit: int = 25) -> List[Dict]:
+    async def fetch_jobs_jsearch(self, keywords: str, location: str, limit: int = 25, page: int = 1) -> List[Dict]:
         """Fetch jobs from JSearch API via RapidAPI - More reliable than Indeed"""
-        api_key = self.api_keys.get('rapidapi_key')
+        api_key = self._credential('rapidapi_key')
         
         if not api_key:
             logger.warning("RapidAPI key not provided for JSearch")
             return []
             
-        url = "https://jsearch.p.rapidapi.com/search"
+        url = f"{self.base_urls['jsearch']}/search"
         headers = {
             **self.headers,
             'X-RapidAPI-Key': api_key,
@@ -147,203 +374,899 @@ class JobAPIClient:
         
         params = {
             'query': f'{keywords} in {location}',
-            'page': '1',
+            'page': str(page),
             'num_pages': '1',
             'date_posted': 'month'  # Get recent jobs
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                await asyncio.sleep(self.request_delay)
-                data = await self._make_async_request(session, url, params=params, headers=headers)
-                
-                if not data or 'data' not in data:
-                    logger.warning("No data received from JSearch API")
-                    return []
-                
-                jobs = []
-                for job in data.get('data', [])[:limit]:
-                    # Extract salary information
-                    salary_min = job.get('job_min_salary')
-                    salary_max = job.get('job_max_salary')
-                    salary_range = None
-                    
-                    if salary_min and salary_max:
-                        salary_range = f"₹{salary_min:,.0f} - ₹{salary_max:,.0f}"
-                    elif salary_min:
-                        salary_range = f"₹{salary_min:,.0f}+"
-                    
-                    jobs.append({
-                        'job_id': job.get('job_id', ''),
-                        'job_title': job.get('job_title', ''),
-                        'company': job.get('employer_name', ''),
-                        'location': job.get('job_location', ''),
-                        'job_description': job.get('job_description', ''),
-                        'salary_min': salary_min,
-                        'salary_max': salary_max,
-                        'salary_range': salary_range,
-                        'job_url': job.get('job_apply_link', ''),
-                        'created_date': job.get('job_posted_at_datetime_utc', ''),
-                        'contract_type': job.get('job_employment_type', ''),
-                        'category': job.get('job_job_title', ''),
-                        'source': 'jsearch'
-                    })
+            session = await self._get_session()
+            data = await self._make_async_request(session, url, params=params, headers=headers,
+                                                  provider='jsearch')
+            
+            if not data or 'data' not in data:
+                logger.warning("No data received from JSearch API")
+                return []
+            
+            jobs = []
+            for job in data.get('data', [])[:limit]:
+                # Extract salary information
+                salary_min = job.get('job_min_salary')
+                salary_max = job.get('job_max_salary')
+                salary_range = None
                 
-                logger.info(f"Fetched {len(jobs)} jobs from JSearch")
-                return jobs
+                if salary_min and salary_max:
+                    salary_range = f"₹{salary_min:,.0f} - ₹{salary_max:,.0f}"
+                elif salary_min:
+                    salary_range = f"₹{salary_min:,.0f}+"
                 
+                jobs.append({
+                    'job_id': job.get('job_id', ''),
+                    'job_title': job.get('job_title', ''),
+                    'company': job.get('employer_name', ''),
+                    'location': job.get('job_location', ''),
+                    'job_description': job.get('job_description', ''),
+                    'salary_min': salary_min,
+                    'salary_max': salary_max,
+                    'salary_range': salary_range,
+                    'job_url': job.get('job_apply_link', ''),
+                    'created_date': job.get('job_posted_at_datetime_utc', ''),
+                    'contract_type': job.get('job_employment_type', ''),
+                    'category': job.get('job_job_title', ''),
+                    'source': 'jsearch'
+                })
+            
+            logger.info(f"Fetched {len(jobs)} jobs from JSearch")
+            return jobs
+            
         except Exception as e:
             logger.error(f"Error in JSearch async fetch: {e}")
             return []
     
-    async def fetch_jobs_jooble(self, keywords: str, location: str, limit: int = 20) -> List[Dict]:
+    async def fetch_jobs_jooble(self, keywords: str, location: str, limit: int = 20, page: int = 1) -> List[Dict]:
         """Fetch jobs from Jooble API asynchronously"""
-        api_key = self.api_keys.get('jooble_api_key')
+        api_key = self._credential('jooble_api_key')
         
         if not api_key:
             logger.warning("Jooble API key not provided")
             return []
             
-        url = f"https://jooble.org/api/{api_key}"
+        url = f"{self.base_urls['jooble']}/{api_key}"
         payload = {
             'keywords': keywords,
             'location': location,
             'searchMode': '1',
-            'page': '1'
+            'page': str(page)
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                await asyncio.sleep(self.request_delay)
-                data = await self._make_async_request(session, url, method='POST', json_data=payload, headers=self.headers)
-                
-                if not data:
-                    return []
-                
-                jobs = []
-                for job in data.get('jobs', [])[:limit]:
-                    jobs.append({
-                        'job_id': job.get('id', ''),
-                        'job_title': job.get('title', ''),
-                        'company': job.get('company', ''),
-                        'location': job.get('location', ''),
-                        'job_description': job.get('snippet', ''),
-                        'salary_min': job.get('salary'),
-                        'salary_max': None,
-                        'salary_range': job.get('salary'),
-                        'job_url': job.get('link', ''),
-                        'created_date': job.get('updated', ''),
-                        'contract_type': job.get('type', ''),
-                        'category': '',
-                        'source': 'jooble'
-                    })
-                
-                logger.info(f"Fetched {len(jobs)} jobs from Jooble")
-                return jobs
-                
+            session = await self._get_session()
+            data = await self._make_async_request(session, url, method='POST', json_data=payload,
+                                                  headers=self.headers, provider='jooble')
+            
+            if not data:
+                return []
+            
+            jobs = []
+            for job in data.get('jobs', [])[:limit]:
+                jobs.append({
+                    'job_id': job.get('id', ''),
+                    'job_title': job.get('title', ''),
+                    'company': job.get('company', ''),
+                    'location': job.get('location', ''),
+                    'job_description': job.get('snippet', ''),
+                    'salary_min': job.get('salary'),
+                    'salary_max': None,
+                    'salary_range': job.get('salary'),
+                    'job_url': job.get('link', ''),
+                    'created_date': job.get('updated', ''),
+                    'contract_type': job.get('type', ''),
+                    'category': '',
+                    'source': 'jooble'
+                })
+            
+            logger.info(f"Fetched {len(jobs)} jobs from Jooble")
+            return jobs
+            
         except Exception as e:
             logger.error(f"Error in Jooble async fetch: {e}")
             return []
     
-    async def fetch_all_jobs_async(self, keywords: str, location: str) -> List[Dict]:
-        """Fetch jobs from all APIs concurrently"""
-        tasks = [
-            self.fetch_jobs_adzuna(keywords, location),
-            self.fetch_jobs_jsearch(keywords, location),  # Using JSearch instead of Indeed
-            self.fetch_jobs_jooble(keywords, location)
-        ]
+    @property
+    def providers(self) -> Dict[str, Any]:
+        """Provider name -> fetch coroutine function"""
+        return {
+            'adzuna': self.fetch_jobs_adzuna,
+            'jsearch': self.fetch_jobs_jsearch,  # Using JSearch instead of Indeed
+            'jooble': self.fetch_jobs_jooble
+        }
+    
+    async def _fetch_provider_hedged(self, provider: str, keywords: str, location: str,
+                                     hedge_after: float) -> List[Dict]:
+        """Fetch from one provider, racing a duplicate request if the first is slow"""
+        fetch = self.providers[provider]
+        first = asyncio.ensure_future(fetch(keywords, location))
+        if not hedge_after:
+            return await first
         
+        done, _ = await asyncio.wait({first}, timeout=hedge_after)
+        if done:
+            return first.result()
+        
+        logger.info(f"Hedging {provider} request after {hedge_after:.1f}s without a response")
+        self.hedged_requests += 1
+        attempts = {first, asyncio.ensure_future(fetch(keywords, location))}
+        cancelled, reason = False, None
         try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            all_jobs = []
-            for result in results:
-                if isinstance(result, list):
-                    all_jobs.extend(result)
-                elif isinstance(result, Exception):
-                    logger.error(f"API fetch error: {result}")
-            
+            # First attempt to come back with jobs wins; the other is cancelled
+            while attempts:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result():
+                        return task.result()
+            return []
+        except asyncio.CancelledError as e:
+            cancelled, reason = True, (e.args[0] if e.args else None)
+            raise
+        finally:
+            for task in attempts:
+                if cancelled:
+                    # Pass on why this fetch was cancelled (deadline or caller)
+                    task.cancel(reason)
+                else:
+                    # A losing first attempt has been slower than hedge_after; the duplicate has not
+                    task.cancel(self.ABANDONED if task is first else None)
+    
+    async def fetch_all_jobs_within_deadline(self, keywords: str, location: str,
+                                             deadline: Optional[float] = None,
+                                             hedge_after: Optional[float] = None,
+                                             on_late_result=None) -> Tuple[List[Dict], Dict[str, Any]]:
+        """Fetch from every provider, returning whatever has arrived by the deadline
+        
+        Returns ``(jobs, report)`` where the report lists ``sources_included`` (providers
+        that returned jobs in time) and ``sources_timed_out``. Providers still running at
+        the deadline are cancelled, or with ``on_late_result(provider, jobs)`` left to
+        finish in the background and handed over when they do.
+        """
+        deadline = self.fetch_deadline if deadline is None else deadline
+        hedge_after = self.hedge_after if hedge_after is None else hedge_after
+        started = time.monotonic()
+        
+        tasks = {
+            asyncio.ensure_future(self._fetch_provider_hedged(provider, keywords, location, hedge_after)): provider
+            for provider in self.providers
+        }
+        done, pending = await asyncio.wait(tasks, timeout=deadline or None)
+        
+        all_jobs = []
+        sources_included = []
+        for task, provider in tasks.items():
+            if task not in done:
+                continue
+            if task.exception() is not None:
+                logger.error(f"API fetch error from {provider}: {task.exception()}")
+                continue
+            if task.result():
+                all_jobs.extend(task.result())
+                sources_included.append(provider)
+        
+        sources_timed_out = [tasks[task] for task in tasks if task in pending]
+        if sources_timed_out:
+            logger.warning(f"Fetch deadline of {deadline:.1f}s passed without {', '.join(sources_timed_out)}")
+        
+        for task in pending:
+            if on_late_result is None:
+                task.cancel(self.ABANDONED)
+            else:
+                task.add_done_callback(
+                    lambda done_task, provider=tasks[task]: self._deliver_late_result(done_task, provider, on_late_result)
+                )
+        
+        report = {
+            'sources_included': sources_included,
+            'sources_timed_out': sources_timed_out,
+            'elapsed_seconds': round(time.monotonic() - started, 3),
+            'deadline_seconds': deadline
+        }
+        return all_jobs, report
+    
+    @staticmethod
+    def _deliver_late_result(task: asyncio.Task, provider: str, on_late_result):
+        if task.cancelled() or task.exception() is not None or not task.result():
+            return
+        try:
+            on_late_result(provider, task.result())
+        except Exception as e:
+            logger.error(f"Error handling late {provider} results: {e}")
+    
+    async def fetch_all_jobs_async(self, keywords: str, location: str) -> List[Dict]:
+        """Fetch jobs from all APIs concurrently, within the fetch deadline"""
+        try:
+            all_jobs, _ = await self.fetch_all_jobs_within_deadline(keywords, location)
             return all_jobs
             
         except Exception as e:
             logger.error(f"Error in concurrent fetch: {e}")
             return []
 
+    async def stream_jobs_async(self, keywords: str, location: str, pages: Optional[int] = None,
+                                deadline: Optional[float] = None,
+                                report: Optional[Dict[str, Any]] = None) -> AsyncIterator[List[Dict]]:
+        """Yield normalised job batches as each provider page arrives
+        
+        Page 1 is requested from every provider at once; a provider's next page is only
+        requested once the previous one came back non-empty, up to ``pages`` deep.
+        The stream ends at the fetch deadline. Closing the generator early cancels any
+        requests still in flight. A ``report`` dict is filled in like the one returned
+        by fetch_all_jobs_within_deadline.
+        """
+        pages = pages or self.page_depth
+        deadline = self.fetch_deadline if deadline is None else deadline
+        report = report if report is not None else {}
+        report.update({'sources_included': [], 'sources_timed_out': [], 'deadline_seconds': deadline})
+        started = time.monotonic()
+        timed_out = False
+        
+        pending = {
+            asyncio.ensure_future(fetch(keywords, location, page=1)): (provider, fetch, 1)
+            for provider, fetch in self.providers.items()
+        }
+        
+        try:
+            while pending:
+                remaining = deadline - (time.monotonic() - started) if deadline else None
+                if remaining is not None and remaining <= 0:
+                    timed_out = True
+                    report['sources_timed_out'] = sorted({provider for provider, _, _ in pending.values()})
+                    logger.warning(f"Fetch deadline of {deadline:.1f}s passed without more from "
+                                   f"{', '.join(report['sources_timed_out'])}")
+                    break
+                
+                done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider, fetch, page = pending.pop(task)
+                    
+                    if task.exception() is not None:
+                        logger.error(f"API fetch error: {task.exception()}")
+                        continue
+                    
+                    batch = task.result()
+                    if not batch:
+                        continue
+                    
+                    if provider not in report['sources_included']:
+                        report['sources_included'].append(provider)
+                    if page < pages:
+                        next_task = asyncio.ensure_future(fetch(keywords, location, page=page + 1))
+                        pending[next_task] = (provider, fetch, page + 1)
+                    
+                    yield batch
+        finally:
+            report['elapsed_seconds'] = round(time.monotonic() - started, 3)
+            # Closing the stream early (enough good matches) says nothing about the providers
+            for task in pending:
+                task.cancel(self.ABANDONED if timed_out else None)
+
 class RealTimeJobMatcher:
     """Main job matching class with semantic matching using sentence-transformers"""
     
-    def __init__(self, api_keys: Dict[str, str] = None, model_name: str = 'all-MiniLM-L6-v2'):
+    # Seniority keywords (checked in order) and the years of experience they imply
+    EXPERIENCE_LEVELS = [
+        (['senior', 'lead', 'principal', 'manager'], 5),
+        (['mid', 'intermediate', 'experienced'], 3),
+        (['junior', 'entry', 'fresher', 'graduate'], 1)
+    ]
+    DEFAULT_REQUIRED_EXPERIENCE = 2
+    
+    def __init__(self, api_keys: Dict[str, str] = None, model_name: str = 'all-MiniLM-L6-v2',
+                 encode_batch_size: int = 64, embedding_store_dir: Optional[str] = None,
+                 cache_limits: Dict[str, Any] = None, job_store: Optional[JobStore] = None,
+                 inference_pool: Optional[InferencePool] = None):
         self.api_client = JobAPIClient(api_keys)
+        self.encode_batch_size = encode_batch_size
+        # Encoding and scoring run here when called from the event loop
+        self.inference_pool = inference_pool or get_inference_pool()
+        self.embedding_dim = 384  # Default size for MiniLM models
         
-        # Load sentence transformer model
+        # Load sentence transformer model (torch is imported here, on first use, not at import)
         try:
+            from sentence_transformers import SentenceTransformer
             self.model = SentenceTransformer(model_name)
             logger.info(f"Loaded sentence transformer model: {model_name}")
         except Exception as e:
             logger.error(f"Failed to load model {model_name}: {e}")
             # Fallback to smaller model
             try:
+                from sentence_transformers import SentenceTransformer
                 self.model = SentenceTransformer('all-MiniLM-L6-v2')
                 logger.info("Loaded fallback model: all-MiniLM-L6-v2")
             except:
                 logger.error("Failed to load any sentence transformer model")
                 self.model = None
         
-        self.job_cache = {}
-        self.cache_expiry = timedelta(hours=1)
-        self.embedding_cache = {}  # Cache for job embeddings
+        if self.model is not None and hasattr(self.model, 'get_sentence_embedding_dimension'):
+            self.embedding_dim = self.model.get_sentence_embedding_dimension() or self.embedding_dim
+        
+        # Encode calls from concurrent requests are coalesced into one model.encode
+        self.embedding_batcher = None
+        if self.model is not None and os.getenv('EMBEDDING_MICRO_BATCHING', '1') == '1':
+            self.embedding_batcher = EmbeddingBatcher(self.model, encode_batch_size=encode_batch_size)
+        
+        # Load cache limits from environment variables if not provided
+        if cache_limits is None:
+            cache_limits = {
+                'job_cache_max_entries': int(os.getenv('JOB_CACHE_MAX_ENTRIES', 256)),
+                'job_cache_max_mb': float(os.getenv('JOB_CACHE_MAX_MB', 64)),
+                'job_cache_ttl_minutes': float(os.getenv('JOB_CACHE_TTL_MINUTES', 60)),
+                'job_cache_stale_grace_minutes': float(os.getenv('JOB_CACHE_STALE_GRACE_MINUTES', 0)),
+                'embedding_cache_max_entries': int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', 10000)),
+                'embedding_cache_max_mb': float(os.getenv('EMBEDDING_CACHE_MAX_MB', 16)),
+                'embedding_cache_ttl_minutes': float(os.getenv('EMBEDDING_CACHE_TTL_MINUTES', 24 * 60)),
+                'job_corpus_max_entries': int(os.getenv('JOB_CORPUS_MAX_ENTRIES', 50000)),
+                'job_corpus_ttl_hours': float(os.getenv('JOB_CORPUS_TTL_HOURS', 24))
+            }
+        self.cache_limits = cache_limits
+        
+        self.cache_expiry = timedelta(minutes=cache_limits.get('job_cache_ttl_minutes', 60))
+        self.job_cache = BoundedCache(
+            max_entries=cache_limits.get('job_cache_max_entries'),
+            max_bytes=int(cache_limits.get('job_cache_max_mb', 64) * 1024 * 1024),
+            ttl=self.cache_expiry,
+            stale_grace=timedelta(minutes=cache_limits.get('job_cache_stale_grace_minutes', 0)),
+            on_evict=lambda key, jobs: self._forget_cache_key(key)
+        )
+        # Running statistics per job_cache key, built as jobs are ingested
+        self.job_stats: Dict[str, JobStatistics] = {}
+        # Which providers made it into each cached job list
+        self.fetch_reports: Dict[str, Dict[str, Any]] = {}
+        # Cache for query and profile embeddings; job embeddings are kept quantised in job_index
+        self.embedding_cache = BoundedCache(
+            max_entries=cache_limits.get('embedding_cache_max_entries'),
+            max_bytes=int(cache_limits.get('embedding_cache_max_mb', 16) * 1024 * 1024),
+            ttl=timedelta(minutes=cache_limits.get('embedding_cache_ttl_minutes', 24 * 60))
+        )
+        
+        # Persistent embedding store shared by every worker process
+        self.embedding_store = None
+        embedding_store_dir = embedding_store_dir or os.getenv('JOB_EMBEDDING_STORE_DIR')
+        if embedding_store_dir and self.model:
+            try:
+                store_path = Path(embedding_store_dir) / model_name.replace('/', '__')
+                self.embedding_store = EmbeddingStore(store_path, dim=self.embedding_dim)
+                logger.info(f"Opened embedding store at {store_path} with {len(self.embedding_store)} embeddings")
+            except Exception as e:
+                logger.error(f"Failed to open embedding store: {e}")
+                self.embedding_store = None
+        
+        # Every job seen across keyword/location fetches, searchable through an ANN index
+        self.ann_min_corpus_size = int(os.getenv('JOB_ANN_MIN_CORPUS', 1000))
+        self.ann_candidates = int(os.getenv('JOB_ANN_CANDIDATES', 200))
+        # int8 rows keep ~4x more job embeddings in memory than float32 (see embedding_recall_report)
+        self.job_index = IVFIndex(dim=self.embedding_dim,
+                                  vector_dtype=os.getenv('JOB_INDEX_VECTOR_DTYPE', 'int8'))
+        self.job_corpus = BoundedCache(
+            max_entries=cache_limits.get('job_corpus_max_entries', 50000),
+            ttl=timedelta(hours=cache_limits.get('job_corpus_ttl_hours', 24)),
+            on_evict=lambda key, job: self._unindex_job(key)
+        )
+        # Lexical first stage: only the BM25 top candidates of a search are embedded
+        self.lexical_index = BM25Index()
+        self.bm25_candidates = int(os.getenv('JOB_BM25_CANDIDATES', 100))
+        # Jobs enter the ANN index when first scored as BM25 candidates. Optionally the rest
+        # are embedded in the background too, at most this many per second (0 = never),
+        # on a thread of their own so requests on the inference pool are not held up
+        self.background_embed_rate = float(os.getenv('JOB_BACKGROUND_EMBED_PER_SEC', 0))
+        self.indexing_pool = InferencePool(max_workers=1, name='job-indexer')
+        
+        # MongoDB copy of fetched jobs, shared across workers and restarts
+        self.job_store = job_store
+        
+        # Observed searches, ranked by the cache warmer
+        self.query_log = QueryLog()
+        
+        # Provider fetches currently running, keyed like job_cache
+        self.inflight_fetches = SingleFlight()
+        
+        # Merge near-duplicate postings across providers (MinHash/LSH)
+        self.near_dedup_enabled = os.getenv('JOB_NEAR_DEDUP', '1') == '1'
+        
+        # Streaming recommendations stop early once the top_k-th score reaches this
+        self.streaming_enabled = os.getenv('JOB_STREAMING', '1') == '1'
+        self.stream_stop_score = float(os.getenv('JOB_STREAM_STOP_SCORE', 0.75))
+        # Results from a stream that stopped early are only cached briefly
+        self.partial_cache_expiry = timedelta(minutes=float(os.getenv('JOB_PARTIAL_CACHE_TTL_MINUTES', 5)))
     
     async def fetch_and_cache_jobs_async(self, keywords: str, location: str, 
                                        refresh_cache: bool = False) -> List[Dict]:
         """Fetch jobs from multiple APIs asynchronously and cache them"""
-        cache_key = f"{keywords.lower()}_{location.lower()}"
-        current_time = datetime.now()
+        cache_key = self._cache_key(keywords, location)
+        self.query_log.record(keywords, location)
         
         # Check cache
-        if not refresh_cache and cache_key in self.job_cache:
-            cached_data, timestamp = self.job_cache[cache_key]
-            if current_time - timestamp < self.cache_expiry:
-                logger.info("Using cached job data")
+        if not refresh_cache:
+            cached_data, is_stale = self.job_cache.get_with_staleness(cache_key)
+            if cached_data is not None:
+                if is_stale:
+                    # Stale-while-revalidate: answer now, refresh in the background
+                    logger.info("Using stale job data while revalidating")
+                    self._schedule_refresh(keywords, location, cache_key)
+                else:
+                    logger.info("Using cached job data")
                 return cached_data
         
+        # Concurrent identical searches share one upstream fetch
+        if cache_key in self.inflight_fetches:
+            logger.info(f"Joining in-flight fetch for '{keywords}' in '{location}'")
+        return await self.inflight_fetches.do(
+            cache_key, lambda: self._fetch_and_store_jobs(keywords, location, cache_key,
+                                                          use_store=not refresh_cache)
+        )
+    
+    async def warm_cache(self, keywords: str, location: str) -> List[Dict]:
+        """Fetch, cache and embed a search ahead of demand (not counted as a user query)"""
+        cache_key = self._cache_key(keywords, location)
+        # Warming is for fresh provider results, not the rows already in MongoDB
+        return await self.inflight_fetches.do(
+            cache_key, lambda: self._fetch_and_store_jobs(keywords, location, cache_key, use_store=False)
+        )
+    
+    def _schedule_refresh(self, keywords: str, location: str, cache_key: str):
+        """Start one background refresh per key; concurrent stale hits share it"""
+        if cache_key in self.inflight_fetches:
+            return
+        
+        # The stored rows are at most as fresh as the stale cache entry, so ask the providers
+        task = self.inflight_fetches.start(
+            cache_key, lambda: self._fetch_and_store_jobs(keywords, location, cache_key, use_store=False)
+        )
+        task.add_done_callback(self._log_refresh_result)
+    
+    @staticmethod
+    def _log_refresh_result(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background job cache refresh failed: {task.exception()}")
+    
+    async def _fetch_and_store_jobs(self, keywords: str, location: str, cache_key: str,
+                                    use_store: bool = True) -> List[Dict]:
+        """Fetch from every provider, de-duplicate, cache and index
+        
+        With ``use_store``, jobs another worker stored for this search within the cache
+        expiry are used instead of calling the providers.
+        """
+        if use_store and self.job_store is not None:
+            stored_jobs = await self._load_stored_jobs(cache_key)
+            if stored_jobs:
+                return stored_jobs
+        
         logger.info(f"Fetching fresh job data for '{keywords}' in '{location}'")
         
-        # Fetch jobs asynchronously
-        all_jobs = await self.api_client.fetch_all_jobs_async(keywords, location)
+        # Fetch asynchronously within the latency budget; stragglers are merged in later
+        all_jobs, report = await self.api_client.fetch_all_jobs_within_deadline(
+            keywords, location,
+            on_late_result=lambda provider, jobs: self._merge_late_jobs(cache_key, provider, jobs)
+        )
         
-        # Remove duplicates
-        seen = set()
-        unique_jobs = []
-        for job in all_jobs:
-            job_key = (
-                job['job_title'].lower().strip(),
-                job['company'].lower().strip(),
-                job['location'].lower().strip()
-            )
-            
-            if job_key not in seen and job['job_title'].strip():
-                seen.add(job_key)
-                unique_jobs.append(job)
+        # Remove exact and near duplicates
+        unique_jobs = self._deduplicate_jobs(all_jobs, set(), self._near_duplicate_index())
         
         # Cache results
         if unique_jobs:
-            self.job_cache[cache_key] = (unique_jobs, current_time)
+            self._store_jobs(cache_key, unique_jobs, self.cache_expiry)
+            self.fetch_reports[cache_key] = report
         
         logger.info(f"Fetched {len(unique_jobs)} unique jobs from {len(all_jobs)} total")
         return unique_jobs
     
+    def _merge_late_jobs(self, cache_key: str, provider: str, jobs: List[Dict]):
+        """Fold results from a provider that missed the fetch deadline into the cached list
+        
+        Only the incoming jobs are de-duplicated, against the cached ones; when nothing
+        was cached (no provider answered in time) they become the cached list.
+        """
+        cached_jobs, _ = self.job_cache.peek(cache_key)
+        near_duplicates = self._near_duplicate_index()
+        if cached_jobs is None:
+            new_jobs = self._deduplicate_jobs(jobs, set(), near_duplicates)
+            if not new_jobs:
+                return
+            self._store_jobs(cache_key, new_jobs, self.cache_expiry)
+        else:
+            seen = {self._job_key(job) for job in cached_jobs}
+            if near_duplicates is not None:
+                for job in cached_jobs:
+                    near_duplicates.add(job)
+            new_jobs = self._deduplicate_jobs(jobs, seen, near_duplicates)
+            self._store_jobs(cache_key, cached_jobs + new_jobs, self.cache_expiry, added=new_jobs)
+        
+        report = self.fetch_reports.setdefault(cache_key, {'sources_included': [], 'sources_timed_out': []})
+        if provider in report['sources_timed_out']:
+            report['sources_timed_out'].remove(provider)
+        report['sources_included'].append(provider)
+        report.setdefault('sources_late', []).append(provider)
+        logger.info(f"Merged {len(new_jobs)} late {provider} jobs into '{cache_key}'")
+    
+    def _forget_cache_key(self, cache_key: str):
+        self.job_stats.pop(cache_key, None)
+        self.fetch_reports.pop(cache_key, None)
+    
+    def get_fetch_report(self, keywords: str, location: str) -> Dict[str, Any]:
+        """Which providers are in the cached results for this search"""
+        return self.fetch_reports.get(self._cache_key(keywords, location), {})
+    
+    def _store_jobs(self, cache_key: str, jobs: List[Dict], ttl: timedelta, persist: bool = True,
+                    added: Optional[List[Dict]] = None):
+        """Cache a fetched job list, update its running statistics, index and persist it
+        
+        Only the BM25 index is updated here; jobs are embedded when first scored, or by
+        the rate-limited background pass if enabled, never before the jobs are returned. When ``jobs`` extends the cached list by
+        ``added``, only those are counted, indexed and persisted.
+        """
+        job_stats = self.job_stats.get(cache_key)
+        if added is not None and job_stats is not None:
+            job_stats.add_many(added)
+        else:
+            self.job_stats[cache_key] = JobStatistics(jobs)
+        self.job_cache.set(cache_key, jobs, ttl=ttl)
+        
+        new_jobs = jobs if added is None else added
+        if persist and self.job_store is not None:
+            self._persist_jobs(cache_key, new_jobs)
+        
+        self._index_jobs(new_jobs)
+        if self.background_embed_rate > 0:
+            self.indexing_pool.submit(self._embed_jobs, new_jobs)
+    
+    def _persist_jobs(self, cache_key: str, jobs: List[Dict]):
+        """Bulk-upsert jobs into MongoDB off the event loop, without delaying the response"""
+        # Documents are built here, before other code can mutate the job dicts
+        documents = [JobStore.to_document(job) for job in jobs]
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop is None:
+            try:
+                self.job_store.upsert_documents(documents, cache_key)
+            except Exception as e:
+                logger.error(f"Error persisting jobs for '{cache_key}': {e}")
+            return
+        
+        future = loop.run_in_executor(None, self.job_store.upsert_documents, documents, cache_key)
+        future.add_done_callback(lambda done: self._log_persist_result(done, cache_key))
+    
+    @staticmethod
+    def _log_persist_result(future: asyncio.Future, cache_key: str):
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.error(f"Error persisting jobs for '{cache_key}': {future.exception()}")
+        else:
+            counts = future.result()
+            logger.info(f"Persisted jobs for '{cache_key}': {counts['upserted']} new, {counts['modified']} updated")
+    
+    async def _load_stored_jobs(self, cache_key: str) -> List[Dict]:
+        """Recent jobs for this search from MongoDB, cached for the rest of their lifetime"""
+        loop = asyncio.get_running_loop()
+        try:
+            jobs, age = await loop.run_in_executor(None, self.job_store.find_recent, cache_key, self.cache_expiry)
+        except Exception as e:
+            logger.error(f"Error loading stored jobs for '{cache_key}': {e}")
+            return []
+        
+        if not jobs:
+            return []
+        
+        self._store_jobs(cache_key, jobs, self.cache_expiry - age, persist=False)
+        self.fetch_reports[cache_key] = {
+            'sources_included': sorted({job.get('source', '') for job in jobs} - {''}),
+            'sources_timed_out': [],
+            'from_store': True
+        }
+        logger.info(f"Loaded {len(jobs)} stored jobs for '{cache_key}' from MongoDB")
+        return jobs
+    
+    @staticmethod
+    def _cache_key(keywords: str, location: str) -> str:
+        return f"{keywords.lower()}_{location.lower()}"
+    
+    def _deduplicate_jobs(self, jobs: List[Dict], seen: set,
+                          near_duplicates: Optional[NearDuplicateIndex] = None) -> List[Dict]:
+        """Drop jobs without a title or already in ``seen`` (updated in place)
+        
+        With ``near_duplicates``, postings that only differ slightly from an earlier one
+        (typically the same job from another provider) are merged into it.
+        """
+        unique_jobs = []
+        for job in jobs:
+            job_key = self._job_key(job)
+            
+            if job_key in seen or not (job.get('job_title') or '').strip():
+                continue
+            seen.add(job_key)
+            
+            if near_duplicates is not None:
+                original = near_duplicates.find_or_add(job)
+                if original is not None:
+                    merge_duplicate(original, job)
+                    continue
+            
+            unique_jobs.append(job)
+        
+        return unique_jobs
+    
+    def _near_duplicate_index(self) -> Optional[NearDuplicateIndex]:
+        return NearDuplicateIndex() if self.near_dedup_enabled else None
+    
+    @staticmethod
+    def _job_key(job: Dict) -> str:
+        """Identity of a posting across searches (same fields as de-duplication)"""
+        return '|'.join(
+            (job.get(field) or '').lower().strip()
+            for field in ('job_title', 'company', 'location')
+        )
+    
+    def _index_jobs(self, jobs: List[Dict]):
+        """Add fetched jobs to the cross-search corpus and its BM25 index (no encoding)"""
+        jobs = [job for job in jobs if self._job_text(job)]
+        if not jobs:
+            return
+        
+        try:
+            keys = [self._job_key(job) for job in jobs]
+            
+            # Index before the corpus so a key the corpus evicts straight away is also unindexed
+            self.lexical_index.add(keys, [self._job_text(job) for job in jobs])
+            for key, job in zip(keys, jobs):
+                self.job_corpus.set(key, job)
+                
+        except Exception as e:
+            logger.error(f"Error indexing jobs: {e}")
+    
+    def _embed_jobs(self, jobs: List[Dict]):
+        """Add corpus jobs not yet in the ANN index to it, ``encode_batch_size`` at a time
+        
+        Jobs already scored as BM25 candidates were indexed then and are skipped; the
+        rest are encoded here, in the background, pausing between batches to stay under
+        ``background_embed_rate`` jobs per second.
+        """
+        if not self.model:
+            return
+        
+        pending = {}
+        for job in jobs:
+            key = self._job_key(job)
+            if key in self.job_corpus and key not in self.job_index and self._job_text(job):
+                pending.setdefault(key, self._job_text(job))
+        
+        keys = list(pending)
+        for start in range(0, len(keys), self.encode_batch_size):
+            batch = keys[start:start + self.encode_batch_size]
+            try:
+                self.job_index.add(batch, self._get_job_embeddings([pending[key] for key in batch], cache=False))
+                # Keys the corpus evicted while they were being encoded
+                self.job_index.remove([key for key in batch if key not in self.job_corpus])
+            except Exception as e:
+                logger.error(f"Error embedding jobs for the ANN index: {e}")
+                return
+            time.sleep(len(batch) / self.background_embed_rate)
+    
+    def _unindex_job(self, key: str):
+        self.job_index.remove([key])
+        self.lexical_index.remove([key])
+    
+    def _lexical_candidates(self, user_profile: Dict, jobs: List[Dict]) -> List[Dict]:
+        """BM25 top ``bm25_candidates`` of the fetched jobs for the user's skills and roles
+        
+        Jobs without any query term fill the remaining slots, those sharing the most
+        taxonomy skills first (synonyms such as nodejs/node.js count), so a profile worded
+        differently from the postings still gets semantically scored jobs.
+        """
+        if len(jobs) <= self.bm25_candidates:
+            return jobs
+        
+        by_key = {}
+        for job in jobs:
+            by_key.setdefault(self._job_key(job), job)
+        
+        results = self.lexical_index.search(self._user_text(user_profile), k=self.bm25_candidates,
+                                            restrict_to=by_key.keys())
+        candidates = [by_key[key] for key, _ in results]
+        if len(candidates) < self.bm25_candidates:
+            chosen = {key for key, _ in results}
+            rest = [job for key, job in by_key.items() if key not in chosen]
+            user_skills = skill_taxonomy.encode(self._user_text(user_profile))
+            if user_skills:
+                overlaps = [skill_taxonomy.overlap(user_skills, skill_taxonomy.encode(self._job_text(job)))
+                            for job in rest]
+                rest = [rest[i] for i in sorted(range(len(rest)), key=lambda i: -overlaps[i])]
+            candidates.extend(rest[:self.bm25_candidates - len(candidates)])
+        
+        logger.info(f"BM25 kept {len(candidates)} of {len(jobs)} fetched jobs "
+                    f"({len(results)} matched the profile terms)")
+        return candidates
+    
+    def _ann_candidates(self, user_profile: Dict) -> Optional[Tuple[List[Dict], np.ndarray]]:
+        """Top semantic candidates from the whole job corpus, or None to score the fetched jobs"""
+        if not self.model or len(self.job_index) < self.ann_min_corpus_size:
+            return None
+        
+        user_text = self._user_text(user_profile)
+        if not user_text:
+            return None
+        
+        try:
+            user_embedding = self._get_job_embedding(user_text)
+            results = self.job_index.search(user_embedding, k=self.ann_candidates)
+        except Exception as e:
+            logger.error(f"ANN search failed: {e}")
+            return None
+        
+        candidates = []
+        similarities = []
+        for key, similarity in results:
+            job = self.job_corpus.get(key)
+            if job is not None:
+                candidates.append(job)
+                similarities.append(similarity)
+        
+        if not candidates:
+            return None
+        
+        # Same 0-1 normalisation as calculate_semantic_match_score
+        semantic_scores = np.clip((np.array(similarities, dtype=np.float32) + 1) / 2, 0.0, 1.0)
+        return candidates, semantic_scores
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts through the micro-batcher, or directly when it is disabled"""
+        if self.embedding_batcher is not None:
+            return self.embedding_batcher.encode(texts)
+        encoded = self.model.encode(
+            texts,
+            batch_size=self.encode_batch_size,
+            convert_to_tensor=False,
+            show_progress_bar=False
+        )
+        return np.asarray(encoded, dtype=np.float32)
+    
     def _get_job_embedding(self, job_text: str) -> np.ndarray:
         """Get embedding for job text with caching"""
-        if job_text in self.embedding_cache:
-            return self.embedding_cache[job_text]
+        embedding = self.embedding_cache.get(job_text)
+        if embedding is not None:
+            return embedding
         
         if self.model:
-            embedding = self.model.encode(job_text, convert_to_tensor=False)
-            self.embedding_cache[job_text] = embedding
+            embedding = self._encode([job_text])[0]
+            self.embedding_cache.set(job_text, embedding)
             return embedding
         else:
             # Fallback: return zero vector if model not available
-            return np.zeros(384)  # Default size for MiniLM models
+            return np.zeros(self.embedding_dim)
+    
+    def _get_job_embeddings(self, job_texts: List[str], cache: bool = True) -> np.ndarray:
+        """Get embeddings for many texts, encoding every uncached text in a single batch
+        
+        With ``cache=False`` (job postings, which are kept in job_index instead) new
+        embeddings are not added to the embedding cache.
+        """
+        if not self.model:
+            return np.zeros((len(job_texts), self.embedding_dim), dtype=np.float32)
+        
+        # Collect locally so entries evicted mid-call are still available for stacking
+        embeddings = {}
+        missing = []
+        for text in dict.fromkeys(job_texts):
+            embedding = self.embedding_cache.get(text)
+            if embedding is None:
+                missing.append(text)
+            else:
+                embeddings[text] = embedding
+        
+        # Reuse embeddings already computed by this or another worker
+        if missing and self.embedding_store is not None:
+            try:
+                stored, missing = self.embedding_store.get_many(missing)
+                for text, embedding in stored.items():
+                    embeddings[text] = embedding
+                    if cache:
+                        self.embedding_cache.set(text, embedding)
+            except Exception as e:
+                logger.error(f"Embedding store lookup failed: {e}")
+        
+        if missing:
+            encoded = self._encode(missing)
+            for text, embedding in zip(missing, encoded):
+                embeddings[text] = embedding
+                if cache:
+                    self.embedding_cache.set(text, embedding)
+            
+            if self.embedding_store is not None:
+                try:
+                    self.embedding_store.add_many(missing, encoded)
+                except Exception as e:
+                    logger.error(f"Embedding store append failed: {e}")
+        
+        if not job_texts:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+        
+        return np.stack([embeddings[text] for text in job_texts]).astype(np.float32, copy=False)
+    
+    def _job_embeddings(self, jobs: List[Dict]) -> np.ndarray:
+        """Embeddings of job postings, read back from the quantised rows of job_index
+        
+        Jobs not indexed yet are encoded, and added to the index while they are in the
+        corpus, so scoring never keeps float32 copies of job embeddings around.
+        """
+        keys = [self._job_key(job) for job in jobs]
+        missing = [i for i, key in enumerate(keys) if key not in self.job_index]
+        fresh = {}
+        if missing:
+            encoded = self._get_job_embeddings([self._job_text(jobs[i]) for i in missing], cache=False)
+            fresh = dict(zip(missing, encoded))
+            new_rows = {keys[i]: row for i, row in zip(missing, encoded) if keys[i] in self.job_corpus}
+            if new_rows:
+                self.job_index.add(list(new_rows), np.stack(list(new_rows.values())))
+        
+        # Read the new rows back too, so every job is scored at the index's precision
+        indexed, found = self.job_index.get(keys)
+        embeddings = np.zeros((len(jobs), self.embedding_dim), dtype=np.float32)
+        embeddings[found] = indexed
+        
+        # Jobs outside the corpus are scored from their fresh encoding, without keeping it
+        unindexed = [i for i in np.flatnonzero(~found) if i not in fresh]
+        if unindexed:
+            fresh.update(zip(unindexed, self._get_job_embeddings([self._job_text(jobs[i]) for i in unindexed],
+                                                                 cache=False)))
+        for i in np.flatnonzero(~found):
+            embeddings[i] = fresh[i]
+        return embeddings
+    
+    async def embed_async(self, texts: List[str]) -> np.ndarray:
+        """Awaitable ``_get_job_embeddings``: encodes on the inference pool, off the event loop"""
+        return await self.inference_pool.run(self._get_job_embeddings, texts)
+    
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction counters and memory usage of the matcher caches"""
+        return {
+            'job_cache': self.job_cache.stats(),
+            'embedding_cache': self.embedding_cache.stats(),
+            'job_index': {'size': len(self.job_index), 'vector_dtype': self.job_index.vector_dtype,
+                          'bytes': self.job_index.nbytes},
+            'lexical_index': {'size': len(self.lexical_index)},
+            'inference_pool': self.inference_pool.stats(),
+            'indexing_pool': self.indexing_pool.stats(),
+            'embedding_batcher': self.embedding_batcher.stats() if self.embedding_batcher is not None else {}
+        }
+    
+    def embedding_recall_report(self, user_profiles: List[Dict], k: int = 10) -> Dict[str, Any]:
+        """Top-k recall of the index's vector dtype against float32 scores over the indexed jobs"""
+        if not self.model or len(self.job_corpus) == 0:
+            return {}
+        
+        jobs = [job for job, _ in (self.job_corpus.peek(key) for key in self.job_corpus.keys()) if job]
+        job_embeddings = self._get_job_embeddings([self._job_text(job) for job in jobs], cache=False)
+        user_texts = [self._user_text(profile) for profile in user_profiles if self._user_text(profile)]
+        if not user_texts:
+            return {}
+        
+        queries = self.model.encode(user_texts, convert_to_numpy=True, show_progress_bar=False)
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        job_embeddings = job_embeddings / np.maximum(np.linalg.norm(job_embeddings, axis=1, keepdims=True), 1e-12)
+        return recall_at_k(job_embeddings, queries, k=k, dtype=self.job_index.vector_dtype)
+    
+    @staticmethod
+    def _user_text(user_profile: Dict) -> str:
+        """Text used to embed the user profile"""
+        user_skills = user_profile.get('skills', '')
+        user_preferences = user_profile.get('preferred_roles', '')
+        return f"{user_skills} {user_preferences}".strip()
+    
+    @staticmethod
+    def _job_text(job: Dict) -> str:
+        """Text used to embed a job posting"""
+        job_title = job.get('job_title', '') or ''
+        job_description = job.get('job_description', '') or ''
+        return f"{job_title} {job_description}".strip()
     
     def calculate_semantic_match_score(self, user_profile: Dict, job: Dict) -> Tuple[float, Dict]:
         """Calculate semantic match score using sentence transformers"""
@@ -351,13 +1274,8 @@ class RealTimeJobMatcher:
             return 0.0, {'semantic_match': 0.0}
         
         # Prepare text for embedding
-        user_skills = user_profile.get('skills', '')
-        user_preferences = user_profile.get('preferred_roles', '')
-        user_text = f"{user_skills} {user_preferences}".strip()
-        
-        job_title = job.get('job_title', '')
-        job_description = job.get('job_description', '')
-        job_text = f"{job_title} {job_description}".strip()
+        user_text = self._user_text(user_profile)
+        job_text = self._job_text(job)
         
         if not user_text or not job_text:
             return 0.0, {'semantic_match': 0.0}
@@ -365,13 +1283,11 @@ class RealTimeJobMatcher:
         try:
             # Get embeddings
             user_embedding = self._get_job_embedding(user_text)
-            job_embedding = self._get_job_embedding(job_text)
+            job_embedding = self._job_embeddings([job])[0]
             
             # Calculate cosine similarity
-            similarity = util.pytorch_cos_sim(
-                user_embedding.reshape(1, -1), 
-                job_embedding.reshape(1, -1)
-            ).item()
+            norms = np.linalg.norm(user_embedding) * np.linalg.norm(job_embedding)
+            similarity = float(np.dot(user_embedding, job_embedding) / norms) if norms else 0.0
             
             # Normalize to 0-1 range
             semantic_score = max(0.0, min(1.0, (similarity + 1) / 2))
@@ -382,12 +1298,56 @@ class RealTimeJobMatcher:
             logger.error(f"Error in semantic matching: {e}")
             return 0.0, {'semantic_match': 0.0}
     
-    def calculate_job_match_score(self, user_profile: Dict, job: Dict) -> Tuple[float, Dict]:
-        """Calculate comprehensive match score with semantic matching"""
+    async def calculate_semantic_match_score_async(self, user_profile: Dict, job: Dict) -> Tuple[float, Dict]:
+        """calculate_semantic_match_score on the inference pool, for use from coroutines"""
+        return await self.inference_pool.run(self.calculate_semantic_match_score, user_profile, job)
+    
+    def calculate_semantic_match_scores(self, user_profile: Dict, jobs: List[Dict]) -> np.ndarray:
+        """Calculate semantic match scores for many jobs with one matrix-vector product"""
+        scores = np.zeros(len(jobs), dtype=np.float32)
+        if not self.model or not jobs:
+            return scores
+        
+        user_text = self._user_text(user_profile)
+        if not user_text:
+            return scores
+        
+        job_texts = [self._job_text(job) for job in jobs]
+        has_text = np.array([bool(text) for text in job_texts])
+        if not has_text.any():
+            return scores
+        
+        try:
+            user_embedding = np.asarray(self._get_job_embedding(user_text), dtype=np.float32)
+            job_matrix = self._job_embeddings([job for job, text in zip(jobs, job_texts) if text])
+            
+            # Cosine similarity of every job against the user in a single product
+            norms = np.linalg.norm(job_matrix, axis=1) * np.linalg.norm(user_embedding)
+            similarities = (job_matrix @ user_embedding) / np.maximum(norms, 1e-8)
+            
+            # Normalize to 0-1 range
+            scores[has_text] = np.clip((similarities + 1) / 2, 0.0, 1.0)
+            return scores
+            
+        except Exception as e:
+            logger.error(f"Error in batched semantic matching: {e}")
+            return np.zeros(len(jobs), dtype=np.float32)
+    
+    def calculate_job_match_score(self, user_profile: Dict, job: Dict,
+                                  semantic_score: Optional[float] = None) -> Tuple[float, Dict]:
+        """Calculate comprehensive match score with semantic matching
+        
+        A precomputed ``semantic_score`` (e.g. from ``calculate_semantic_match_scores``)
+        skips the per-job embedding lookup.
+        """
         score_components = {}
         
         # Semantic matching (50% weight)
-        semantic_score, semantic_components = self.calculate_semantic_match_score(user_profile, job)
+        if semantic_score is None:
+            semantic_score, semantic_components = self.calculate_semantic_match_score(user_profile, job)
+        else:
+            semantic_score = float(semantic_score)
+            semantic_components = {'semantic_match': semantic_score}
         score_components.update(semantic_components)
         score_components['semantic_match_weighted'] = semantic_score * 0.5
         
@@ -405,14 +1365,11 @@ class RealTimeJobMatcher:
         experience_bonus = 0
         
         if user_exp >= 0:
-            if any(word in job_text for word in ['senior', 'lead', 'principal', 'manager']):
-                required_exp = 5
-            elif any(word in job_text for word in ['mid', 'intermediate', 'experienced']):
-                required_exp = 3
-            elif any(word in job_text for word in ['junior', 'entry', 'fresher', 'graduate']):
-                required_exp = 1
-            else:
-                required_exp = 2
+            required_exp = self.DEFAULT_REQUIRED_EXPERIENCE
+            for keywords, years in self.EXPERIENCE_LEVELS:
+                if any(word in job_text for word in keywords):
+                    required_exp = years
+                    break
             
             exp_diff = abs(user_exp - required_exp)
             if exp_diff <= 1:
@@ -445,44 +1402,170 @@ class RealTimeJobMatcher:
         
         return total_score, score_components
     
+    def calculate_rule_match_components(self, user_profile: Dict, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Location, experience and salary components for every job in one vectorised pass
+        
+        Column-wise equivalent of the rule-based part of ``calculate_job_match_score``.
+        """
+        n_jobs = len(df)
+        empty = pd.Series([''] * n_jobs, index=df.index)
+        
+        def text_column(name: str) -> pd.Series:
+            return df[name].fillna('').astype(str) if name in df.columns else empty
+        
+        # Location matching (20% weight)
+        user_location = (user_profile.get('location', '') or '').lower()
+        job_locations = text_column('location').str.lower()
+        location_match = np.zeros(n_jobs)
+        if user_location and n_jobs:
+            locations = job_locations.to_numpy(dtype=str)
+            contains_user = np.char.find(locations, user_location) >= 0
+            within_user = np.char.find(user_location, locations) >= 0
+            location_match = np.where((locations != '') & (contains_user | within_user), 0.2, 0.0)
+        
+        # Experience matching (15% weight)
+        user_exp = user_profile.get('experience_years', 0)
+        experience_match = np.zeros(n_jobs)
+        if user_exp >= 0 and n_jobs:
+            job_text = (text_column('job_title') + ' ' + text_column('job_description')).str.lower()
+            conditions = [
+                job_text.str.contains('|'.join(re.escape(word) for word in keywords), regex=True).to_numpy()
+                for keywords, _ in self.EXPERIENCE_LEVELS
+            ]
+            required_exp = np.select(
+                conditions,
+                [years for _, years in self.EXPERIENCE_LEVELS],
+                default=self.DEFAULT_REQUIRED_EXPERIENCE
+            )
+            exp_diff = np.abs(user_exp - required_exp)
+            experience_match = np.select([exp_diff <= 1, exp_diff <= 2, exp_diff <= 3], [0.15, 0.10, 0.05], default=0.0)
+        
+        # Salary expectation matching (15% weight)
+        user_expected_salary = user_profile.get('expected_salary', 0)
+        salary_match = np.zeros(n_jobs)
+        if user_expected_salary > 0 and 'salary_min' in df.columns:
+            job_salary_min = pd.to_numeric(df['salary_min'], errors='coerce').to_numpy(dtype=float)
+            valid = np.nan_to_num(job_salary_min) > 0
+            with np.errstate(invalid='ignore', divide='ignore'):
+                salary_ratio = (np.minimum(user_expected_salary, job_salary_min) /
+                                np.maximum(user_expected_salary, job_salary_min))
+            salary_match = np.where(valid, salary_ratio * 0.15, 0.0)
+        
+        return {
+            'location_match': location_match,
+            'experience_match': experience_match,
+            'salary_match': salary_match
+        }
+    
     async def recommend_jobs_async(self, user_profile: Dict, top_k: int = 10, 
                                  refresh_cache: bool = False) -> List[Dict]:
         """Async method to recommend jobs based on user profile"""
-        user_skills = user_profile.get('skills', '')
-        user_location = user_profile.get('location', 'bangalore')
-        preferred_roles = user_profile.get('preferred_roles', user_skills)
+        search_terms, user_location = self._search_query(user_profile)
         
-        search_terms = preferred_roles if preferred_roles else user_skills
-        
-        # Fetch jobs asynchronously
-        jobs = await self.fetch_and_cache_jobs_async(search_terms, user_location, refresh_cache)
+        # On a cold miss, score provider pages incrementally as they stream in
+        cache_key = self._cache_key(search_terms, user_location)
+        cached_jobs, _ = self.job_cache.peek(cache_key)
+        streamed = {}
+        if (self.streaming_enabled and (refresh_cache or cached_jobs is None)
+                and cache_key not in self.inflight_fetches
+                and len(self.job_index) < self.ann_min_corpus_size):
+            self.query_log.record(search_terms, user_location)
+            # The stream is this search's single-flight fetch: identical requests arriving
+            # meanwhile await its job list and score that instead of streaming again
+            jobs = await self.inflight_fetches.do(
+                cache_key, lambda: self._stream_and_store_jobs(user_profile, search_terms, user_location,
+                                                               cache_key, top_k, streamed,
+                                                               use_store=not refresh_cache)
+            )
+        else:
+            # Fetch jobs asynchronously
+            jobs = await self.fetch_and_cache_jobs_async(search_terms, user_location, refresh_cache)
         
         if not jobs:
             logger.warning("No jobs found")
             return []
         
+        if 'job_scores' in streamed:
+            recommendations = self._format_recommendations(streamed['job_scores'], top_k)
+            logger.info(f"Generated {len(recommendations)} job recommendations")
+            return recommendations
+        
+        # With a large enough corpus, only the ANN top candidates are scored in full;
+        # encoding runs on the inference pool so concurrent fetches keep progressing
+        semantic_scores = None
+        candidates = await self.inference_pool.run(self._ann_candidates, user_profile)
+        jobs = self._lexical_candidates(user_profile, jobs)
+        if candidates is not None:
+            ann_jobs, ann_scores = candidates
+            # This search's own jobs may still be queued for the background ANN pass, so its
+            # BM25 candidates are always scored too (through _job_embeddings)
+            ann_keys = {self._job_key(job) for job in ann_jobs}
+            fetched = [job for job in jobs if self._job_key(job) not in ann_keys]
+            fetched_scores = await self.inference_pool.run(self.calculate_semantic_match_scores,
+                                                           user_profile, fetched)
+            jobs = ann_jobs + fetched
+            semantic_scores = np.concatenate([ann_scores, fetched_scores])
+            logger.info(f"Scoring {len(ann_jobs)} ANN candidates from a corpus of {len(self.job_index)} jobs "
+                        f"and {len(fetched)} fetched jobs not among them")
+        
+        job_scores = await self.inference_pool.run(self._score_jobs, user_profile, jobs, semantic_scores)
+        recommendations = self._format_recommendations(job_scores, top_k)
+        
+        logger.info(f"Generated {len(recommendations)} job recommendations")
+        return recommendations
+    
+    @staticmethod
+    def _search_query(user_profile: Dict) -> Tuple[str, str]:
+        """(keywords, location) searched for a user's recommendations"""
+        user_skills = user_profile.get('skills', '')
+        user_location = user_profile.get('location', 'bangalore')
+        preferred_roles = user_profile.get('preferred_roles', user_skills)
+        
+        search_terms = preferred_roles if preferred_roles else user_skills
+        return search_terms, user_location
+    
+    def _score_jobs(self, user_profile: Dict, jobs: List[Dict],
+                    semantic_scores: Optional[np.ndarray] = None) -> List[Dict]:
+        """Score jobs against the user; returns [{'job', 'score', 'components'}]"""
         df = pd.DataFrame(jobs)
         df['job_description'] = df['job_description'].fillna('')
+        job_records = df.to_dict('records')
+        
+        # Semantic scores for every job in one batched encode + matrix product
+        if semantic_scores is None:
+            semantic_scores = self.calculate_semantic_match_scores(user_profile, job_records)
+        
+        # Rule-based components for all jobs at once, then combine column-wise
+        semantic_scores = np.asarray(semantic_scores, dtype=float)
+        components = self.calculate_rule_match_components(user_profile, df)
+        semantic_weighted = semantic_scores * 0.5
+        total_scores = (semantic_weighted + components['location_match'] +
+                        components['experience_match'] + components['salary_match'])
         
-        # Calculate match scores
         job_scores = []
-        for idx, job in df.iterrows():
-            job_dict = job.to_dict()
-            match_score, score_components = self.calculate_job_match_score(user_profile, job_dict)
+        for idx, job_dict in enumerate(job_records):
             job_scores.append({
-                'index': idx,
-                'score': match_score,
-                'components': score_components
+                'job': job_dict,
+                'score': float(total_scores[idx]),
+                'components': {
+                    'semantic_match': float(semantic_scores[idx]),
+                    'semantic_match_weighted': float(semantic_weighted[idx]),
+                    'location_match': float(components['location_match'][idx]),
+                    'experience_match': float(components['experience_match'][idx]),
+                    'salary_match': float(components['salary_match'][idx])
+                }
             })
         
+        return job_scores
+    
+    def _format_recommendations(self, job_scores: List[Dict], top_k: int) -> List[Dict]:
+        """Top ``top_k`` scored jobs in the recommendation response format"""
         # Sort and get top recommendations
-        job_scores.sort(key=lambda x: x['score'], reverse=True)
-        top_jobs = job_scores[:top_k]
+        top_jobs = heapq.nlargest(top_k, job_scores, key=lambda x: x['score'])
         
         recommendations = []
         for job_score in top_jobs:
-            idx = job_score['index']
-            job = df.iloc[idx]
+            job = job_score['job']
             
             description = job['job_description']
             if len(description) > 300:
@@ -493,6 +1576,7 @@ class RealTimeJobMatcher:
                 'job_title': job['job_title'],
                 'company': job['company'],
                 'location': job['location'],
+                'locations': job.get('locations') or [job['location']],
                 'job_description': description,
                 'salary_min': job.get('salary_min'),
                 'salary_max': job.get('salary_max'),
@@ -507,9 +1591,77 @@ class RealTimeJobMatcher:
             }
             recommendations.append(rec)
         
-        logger.info(f"Generated {len(recommendations)} job recommendations")
         return recommendations
     
+    def _stream_threshold_met(self, job_scores: List[Dict], top_k: int) -> bool:
+        """True once top_k jobs all score at least stream_stop_score"""
+        if len(job_scores) < top_k:
+            return False
+        kth_best = heapq.nlargest(top_k, (job_score['score'] for job_score in job_scores))[-1]
+        return kth_best >= self.stream_stop_score
+    
+    async def _stream_and_store_jobs(self, user_profile: Dict, keywords: str, location: str,
+                                     cache_key: str, top_k: int, streamed: Dict,
+                                     use_store: bool = True) -> List[Dict]:
+        """Fetch by streaming provider pages, scoring them as they arrive for ``user_profile``
+        
+        Stops once the top_k threshold is met, caches the jobs and returns them; the scores
+        are left in ``streamed['job_scores']``. Like ``_fetch_and_store_jobs``, jobs another
+        worker stored for this search are used instead when ``use_store`` is set (and then
+        nothing is scored here).
+        """
+        if use_store and self.job_store is not None:
+            stored_jobs = await self._load_stored_jobs(cache_key)
+            if stored_jobs:
+                return stored_jobs
+        
+        seen = set()
+        near_duplicates = self._near_duplicate_index()
+        unique_jobs = []
+        scored = set()
+        job_scores = []
+        total_jobs = 0
+        stopped_early = False
+        report = {}
+        
+        stream = self.api_client.stream_jobs_async(keywords, location, report=report)
+        try:
+            async for batch in stream:
+                total_jobs += len(batch)
+                new_jobs = self._deduplicate_jobs(batch, seen, near_duplicates)
+                if not new_jobs:
+                    continue
+                
+                unique_jobs.extend(new_jobs)
+                # Only jobs entering the BM25 top candidates of everything streamed so far are scored
+                self._index_jobs(new_jobs)
+                candidates = [job for job in self._lexical_candidates(user_profile, unique_jobs)
+                              if self._job_key(job) not in scored]
+                scored.update(self._job_key(job) for job in candidates)
+                if candidates:
+                    # Later pages keep downloading while this one is scored
+                    job_scores.extend(await self.inference_pool.run(self._score_jobs, user_profile, candidates))
+                
+                if self._stream_threshold_met(job_scores, top_k):
+                    stopped_early = True
+                    logger.info(f"Top {top_k} threshold met after {len(unique_jobs)} jobs; stopping stream")
+                    break
+        finally:
+            await stream.aclose()
+        
+        streamed['job_scores'] = job_scores
+        if not unique_jobs:
+            return []
+        
+        # A truncated result set is cached only briefly
+        truncated = stopped_early or bool(report.get('sources_timed_out'))
+        self._store_jobs(cache_key, unique_jobs,
+                         self.partial_cache_expiry if truncated else self.cache_expiry)
+        self.fetch_reports[cache_key] = report
+        
+        logger.info(f"Streamed {len(unique_jobs)} unique jobs from {total_jobs} total")
+        return unique_jobs
+    
     async def get_job_statistics_async(self, keywords: str, location: str) -> Dict[str, Any]:
         """Async method to get job market statistics"""
         jobs = await self.fetch_and_cache_jobs_async(keywords, location)
@@ -517,72 +1669,79 @@ class RealTimeJobMatcher:
         if not jobs:
             return {}
         
-        df = pd.DataFrame(jobs)
+        # Running aggregates are kept per cache key; rebuild only if they were lost
+        cache_key = self._cache_key(keywords, location)
+        job_stats = self.job_stats.get(cache_key)
+        if job_stats is None or job_stats.total_jobs != len(jobs):
+            job_stats = self.job_stats[cache_key] = JobStatistics(jobs)
         
-        stats = {
-            'total_jobs': len(jobs),
-            'unique_companies': df['company'].nunique(),
-            'top_companies': df['company'].value_counts().head(5).to_dict(),
-            'locations': df['location'].value_counts().to_dict(),
-            'contract_types': df['contract_type'].value_counts().to_dict(),
-            'sources': df['source'].value_counts().to_dict(),
-            'avg_jobs_per_company': round(len(jobs) / max(1, df['company'].nunique()), 2),
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        # Salary statistics
-        salary_jobs = df[df['salary_min'].notna()]
-        if not salary_jobs.empty:
-            stats['salary_stats'] = {
-                'jobs_with_salary': len(salary_jobs),
-                'avg_min_salary': round(salary_jobs['salary_min'].mean(), 2),
-                'median_min_salary': round(salary_jobs['salary_min'].median(), 2),
-                'salary_range': {
-                    'min': salary_jobs['salary_min'].min(),
-                    'max': salary_jobs['salary_max'].max() if 'salary_max' in salary_jobs.columns else None
-                }
-            }
-        
-        return stats
+        return job_stats.summary()
 
 class SyncJobFetcher:
-    """Synchronous wrapper for the async job matcher"""
+    """Synchronous wrapper for the async job matcher
+    
+    Coroutines run on one long-lived background loop per process, so pooled connections
+    and in-flight requests survive across Flask requests.
+    """
     
-    def __init__(self, api_keys: Dict[str, str] = None, model_name: str = 'all-MiniLM-L6-v2'):
-        self.async_matcher = RealTimeJobMatcher(api_keys, model_name)
+    def __init__(self, api_keys: Dict[str, str] = None, model_name: str = 'all-MiniLM-L6-v2',
+                 loop: Optional[BackgroundEventLoop] = None, timeout: Optional[float] = None,
+                 matcher: Optional['RealTimeJobMatcher'] = None):
+        # Pass a shared matcher to avoid loading a second copy of the model
+        self.async_matcher = matcher or RealTimeJobMatcher(api_keys, model_name)
+        self.loop = loop or get_background_loop()
+        self.timeout = timeout if timeout is not None else float(os.getenv('JOB_FETCH_TIMEOUT', 30))
+        # Runs before the loop's own atexit stop (registered earlier), while it still runs
+        atexit.register(self.close)
     
-    def fetch_jobs_sync(self, keywords: str, location: str, limit: int = 20):
+    def _run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the background loop with a per-call timeout"""
+        return self.loop.run(coro, timeout=timeout if timeout is not None else self.timeout)
+    
+    def fetch_jobs_sync(self, keywords: str, location: str, limit: int = 20, timeout: Optional[float] = None):
         """Synchronous method to fetch jobs"""
         try:
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Run the async function
-            jobs = loop.run_until_complete(
-                self.async_matcher.fetch_and_cache_jobs_async(keywords, location)
+            jobs = self._run(
+                self.async_matcher.fetch_and_cache_jobs_async(keywords, location),
+                timeout
             )
-            
-            loop.close()
             return jobs[:limit] if jobs else []
             
+        except concurrent.futures.TimeoutError:
+            logger.error(f"Sync fetch timed out for '{keywords}' in '{location}'")
+            return []
         except Exception as e:
             logger.error(f"Sync fetch error: {e}")
             return []
     
-    def recommend_jobs_sync(self, user_profile: Dict, top_k: int = 10):
+    def recommend_jobs_sync(self, user_profile: Dict, top_k: int = 10, timeout: Optional[float] = None):
         """Synchronous method to get job recommendations"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            recommendations = loop.run_until_complete(
-                self.async_matcher.recommend_jobs_async(user_profile, top_k)
+            return self._run(
+                self.async_matcher.recommend_jobs_async(user_profile, top_k),
+                timeout
             )
             
-            loop.close()
-            return recommendations
-            
+        except concurrent.futures.TimeoutError:
+            logger.error("Sync recommendations timed out")
+            return []
         except Exception as e:
             logger.error(f"Sync recommendations error: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def get_fetch_report(self, keywords: str, location: str) -> Dict[str, Any]:
+        """Providers included in the cached results for a search"""
+        return self.async_matcher.get_fetch_report(keywords, location)
+    
+    def get_recommendation_fetch_report(self, user_profile: Dict) -> Dict[str, Any]:
+        """Providers included in the results a user's recommendations were drawn from"""
+        return self.async_matcher.get_fetch_report(*self.async_matcher._search_query(user_profile))
+    
+    def close(self):
+        """Close the pooled provider session on the background loop"""
+        if not self.loop.is_running:
+            return
+        try:
+            self._run(self.async_matcher.api_client.close(), timeout=5)
+        except Exception as e:
+            logger.error(f"Error closing job API session: {e}")
@@ -0,0 +1,173 @@
+"""
+Incremental Job Market Statistics
+Description: Running counters and a P² streaming quantile sketch, updated as jobs are ingested
+"""
+
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+class P2Quantile:
+    """Streaming quantile estimate in O(1) memory (Jain & Chlamtac P² algorithm)
+
+    Five markers track the minimum, the target quantile, the maximum and the two
+    midpoints between them; each new value nudges the markers with a parabolic fit.
+    The estimate is exact until five values have been seen.
+    """
+
+    def __init__(self, quantile: float = 0.5):
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float):
+        self.count += 1
+        heights = self._heights
+
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # Find the cell the value falls into, stretching the extremes if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        for i in range(cell + 1, 5):
+            self._positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the three middle markers towards their desired positions
+        positions = self._positions
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i]) +
+            (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        if not self._heights:
+            return None
+        if self.count <= 5:
+            # Exact quantile of the few values seen so far, interpolated like pandas
+            rank = self.quantile * (len(self._heights) - 1)
+            low = int(math.floor(rank))
+            high = min(low + 1, len(self._heights) - 1)
+            return self._heights[low] + (rank - low) * (self._heights[high] - self._heights[low])
+        return self._heights[2]
+
+def _as_number(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+class JobStatistics:
+    """Running aggregates for one cached job list
+
+    ``add`` is O(1) per job; ``summary`` is memoised until the next ``add``, so repeated
+    statistics queries neither rescan the jobs nor allocate.
+    """
+
+    COUNTED_FIELDS = ('company', 'location', 'contract_type', 'source')
+
+    def __init__(self, jobs: Iterable[Dict] = ()):
+        self.total_jobs = 0
+        self.counters: Dict[str, Counter] = {field: Counter() for field in self.COUNTED_FIELDS}
+
+        self.jobs_with_salary = 0
+        self._salary_min_sum = 0.0
+        self._salary_min_low: Optional[float] = None
+        self._salary_max_high: Optional[float] = None
+        self._salary_min_median = P2Quantile(0.5)
+
+        self.last_updated: Optional[datetime] = None
+        self._summary: Optional[Dict[str, Any]] = None
+        self.add_many(jobs)
+
+    def add(self, job: Dict):
+        self.total_jobs += 1
+        for field, counter in self.counters.items():
+            value = job.get(field)
+            if value is not None:
+                counter[value] += 1
+
+        salary_min = _as_number(job.get('salary_min'))
+        if salary_min is not None:
+            self.jobs_with_salary += 1
+            self._salary_min_sum += salary_min
+            self._salary_min_median.add(salary_min)
+            if self._salary_min_low is None or salary_min < self._salary_min_low:
+                self._salary_min_low = salary_min
+
+            salary_max = _as_number(job.get('salary_max'))
+            if salary_max is not None and (self._salary_max_high is None or salary_max > self._salary_max_high):
+                self._salary_max_high = salary_max
+
+        self.last_updated = datetime.now()
+        self._summary = None
+
+    def add_many(self, jobs: Iterable[Dict]):
+        for job in jobs:
+            self.add(job)
+
+    def summary(self) -> Dict[str, Any]:
+        """Statistics in the shape returned by get_job_statistics_async"""
+        if self._summary is not None:
+            return self._summary
+
+        if not self.total_jobs:
+            self._summary = {}
+            return self._summary
+
+        companies = self.counters['company']
+        stats = {
+            'total_jobs': self.total_jobs,
+            'unique_companies': len(companies),
+            'top_companies': dict(companies.most_common(5)),
+            'locations': dict(self.counters['location'].most_common()),
+            'contract_types': dict(self.counters['contract_type'].most_common()),
+            'sources': dict(self.counters['source'].most_common()),
+            'avg_jobs_per_company': round(self.total_jobs / max(1, len(companies)), 2),
+            'last_updated': self.last_updated.strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+        if self.jobs_with_salary:
+            stats['salary_stats'] = {
+                'jobs_with_salary': self.jobs_with_salary,
+                'avg_min_salary': round(self._salary_min_sum / self.jobs_with_salary, 2),
+                'median_min_salary': round(self._salary_min_median.value(), 2),
+                'salary_range': {
+                    'min': self._salary_min_low,
+                    'max': self._salary_max_high
+                }
+            }
+
+        self._summary = stats
+        return stats
@@ -0,0 +1,118 @@
+"""
+Quantised Embedding Storage
+Description: Compact int8 (per-vector scale) or float16 embedding rows scored with vectorised dot products
+"""
+
+import numpy as np
+from typing import Dict
+
+SUPPORTED_DTYPES = ('float32', 'float16', 'int8')
+
+class QuantizedVectors:
+    """Growable matrix of embeddings stored as float32, float16 or int8 rows
+
+    int8 rows use symmetric per-vector scaling (``max(|v|) / 127``), so a 384-dim MiniLM
+    embedding takes 388 bytes instead of 1536. Scoring dequantises fixed-size blocks of
+    rows on the fly, so the float32 working set stays bounded whatever the matrix size.
+    """
+
+    BLOCK_ROWS = 4096
+
+    def __init__(self, dim: int, dtype: str = 'int8'):
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"dtype must be one of {SUPPORTED_DTYPES}")
+        self.dim = dim
+        self.dtype = dtype
+        self._data = np.zeros((0, dim), dtype=np.dtype(dtype))
+        self._scales = np.ones(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes + (self._scales.nbytes if self.dtype == 'int8' else 0)
+
+    def encode(self, vectors: np.ndarray):
+        """Quantise float vectors; returns (rows, scales)"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if self.dtype == 'int8':
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+            rows = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+            return rows, scales
+        return vectors.astype(self.dtype), np.ones(len(vectors), dtype=np.float32)
+
+    def resize(self, capacity: int):
+        """Grow or shrink the backing arrays, keeping existing rows"""
+        data = np.zeros((capacity, self.dim), dtype=self._data.dtype)
+        scales = np.ones(capacity, dtype=np.float32)
+        keep = min(capacity, len(self._data))
+        data[:keep] = self._data[:keep]
+        scales[:keep] = self._scales[:keep]
+        self._data, self._scales = data, scales
+
+    def __setitem__(self, rows, vectors: np.ndarray):
+        encoded, scales = self.encode(vectors)
+        self._data[rows] = encoded
+        self._scales[rows] = scales
+
+    def take(self, rows) -> 'QuantizedVectors':
+        """Copy of the selected rows"""
+        subset = QuantizedVectors(self.dim, self.dtype)
+        subset._data = self._data[rows].copy()
+        subset._scales = self._scales[rows].copy()
+        return subset
+
+    def decode(self, rows=slice(None)) -> np.ndarray:
+        """Dequantised float32 copy of the selected rows"""
+        data = self._data[rows].astype(np.float32)
+        if self.dtype == 'int8':
+            data *= self._scales[rows].reshape(-1, 1)
+        return data
+
+    def dot(self, query: np.ndarray, rows=slice(None)) -> np.ndarray:
+        """Dot products of a float32 query with the selected rows"""
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        data = self._data[rows]
+        if self.dtype == 'float32':
+            return data @ query
+
+        scores = np.empty(len(data), dtype=np.float32)
+        for start in range(0, len(data), self.BLOCK_ROWS):
+            block = data[start:start + self.BLOCK_ROWS].astype(np.float32)
+            scores[start:start + self.BLOCK_ROWS] = block @ query
+
+        if self.dtype == 'int8':
+            # One rescale per row instead of dequantising every element
+            scores *= self._scales[rows]
+        return scores
+
+def recall_at_k(vectors: np.ndarray, queries: np.ndarray, k: int = 10,
+                dtype: str = 'int8') -> Dict[str, float]:
+    """Top-k recall of quantised scoring against exact float32 scoring
+
+    Returns the mean recall over ``queries`` together with the storage size per vector,
+    which is what to weigh when choosing a dtype.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    queries = np.asarray(queries, dtype=np.float32).reshape(-1, vectors.shape[1])
+    k = min(k, len(vectors))
+
+    quantized = QuantizedVectors(vectors.shape[1], dtype)
+    quantized.resize(len(vectors))
+    quantized[:len(vectors)] = vectors
+
+    recalls = []
+    for query in queries:
+        exact = set(np.argpartition(-(vectors @ query), k - 1)[:k])
+        approx = set(np.argpartition(-quantized.dot(query), k - 1)[:k])
+        recalls.append(len(exact & approx) / k)
+
+    return {
+        'dtype': dtype,
+        'k': k,
+        'recall': float(np.mean(recalls)) if recalls else 1.0,
+        'bytes_per_vector': quantized.nbytes / max(1, len(vectors)),
+        'float32_bytes_per_vector': vectors.shape[1] * 4
+    }
@@ -19,6 +19,7 @@ from typing import Dict, List, Any, Tuple, Optional, Union
 import json
 from datetime import datetime
 import io
+from app.ml_models.skill_taxonomy import skill_taxonomy
 
 # Handle optional dependencies
 try:
@@ -34,14 +35,16 @@ except ImportError:
     HAS_DOCX = False
 
 # Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
+def ensure_nltk_data():
+    """Download missing NLTK corpora on first use rather than at import time"""
+    try:
+        nltk.data.find('tokenizers/punkt')
+        nltk.data.find('corpora/stopwords')
+        nltk.data.find('corpora/wordnet')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
+        nltk.download('stopwords', quiet=True)
+        nltk.download('wordnet', quiet=True)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -51,40 +54,12 @@ class ResumeParser:
     """Parse and extract information from resume documents"""
     
     def __init__(self):
+        ensure_nltk_data()
         self.lemmatizer = WordNetLemmatizer()
         self.stop_words = set(stopwords.words('english'))
         
-        # Enhanced industry-specific skill keywords
-        self.skill_keywords = {
-            'programming': [
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust',
-                'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'nosql', 'graphql'
-            ],
-            'web_development': [
-                'react', 'angular', 'vue', 'svelte', 'nodejs', 'express', 'django', 'flask',
-                'fastapi', 'html', 'css', 'bootstrap', 'tailwind', 'sass', 'webpack', 'vite', 'npm', 'yarn'
-            ],
-            'data_science': [
-                'machine learning', 'deep learning', 'ai', 'artificial intelligence',
-                'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'xgboost',
-                'pandas', 'numpy', 'matplotlib', 'seaborn', 'plotly', 'jupyter', 'anaconda',
-                'statistical analysis', 'data visualization', 'big data', 'hadoop', 'spark', 'pyspark'
-            ],
-            'cloud_devops': [
-                'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'git',
-                'github', 'gitlab', 'terraform', 'ansible', 'ci/cd', 'devops', 'microservices',
-                'linux', 'bash', 'shell scripting', 'nginx', 'apache'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch',
-                'oracle', 'sqlite', 'cassandra', 'dynamodb', 'cosmosdb', 'snowflake'
-            ],
-            'soft_skills': [
-                'leadership', 'communication', 'teamwork', 'collaboration', 'problem solving',
-                'project management', 'analytical thinking', 'creativity', 'adaptability',
-                'time management', 'critical thinking', 'decision making', 'negotiation'
-            ]
-        }
+        # Skill keywords per category, from the shared taxonomy
+        self.skill_keywords = skill_taxonomy.keywords_by_category()
         
     def extract_text_from_pdf(self, file_content: bytes) -> Optional[str]:
         """Extract text from PDF file with better error handling"""
@@ -222,24 +197,8 @@ class ResumeParser:
         if not text:
             return {category: [] for category in self.skill_keywords}
             
-        text_lower = text.lower()
-        found_skills = {category: [] for category in self.skill_keywords}
-        
-        for category, skills in self.skill_keywords.items():
-            for skill in skills:
-                # More flexible pattern matching
-                skill_patterns = [
-                    rf'\b{re.escape(skill)}\b',
-                    rf'\b{re.escape(skill.replace(" ", "-"))}\b',
-                    rf'\b{re.escape(skill.replace(" ", "_"))}\b',
-                    rf'\b{re.escape(skill.replace(" ", ""))}\b'
-                ]
-                
-                for pattern in skill_patterns:
-                    if re.search(pattern, text_lower):
-                        if skill not in found_skills[category]:  # Avoid duplicates
-                            found_skills[category].append(skill)
-                        break
+        # Synonyms resolve to one canonical name (nodejs -> node.js, postgres -> postgresql)
+        found_skills = skill_taxonomy.by_category(skill_taxonomy.encode(text))
         
         return found_skills
 
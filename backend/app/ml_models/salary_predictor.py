@@ -15,11 +15,17 @@ import re
 from dataclasses import dataclass
 import sqlite3
 import os
+from app.ml_models.skill_taxonomy import skill_taxonomy
+from app.services.cassette import REDACTED, Cassette, CassetteHTTP, get_cassette
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Skill groups behind the has_ml_skills / has_cloud_skills features
+ML_SKILLS_MASK = skill_taxonomy.mask(['machine learning', 'tensorflow', 'pytorch'])
+CLOUD_SKILLS_MASK = skill_taxonomy.mask(['aws', 'azure', 'gcp'])
+
 @dataclass
 class SalaryPrediction:
     """Data class for salary prediction results"""
@@ -42,6 +48,17 @@ class SalaryDataCollector:
         self.cache = {}
         self.cache_expiry = timedelta(hours=6)  # Cache for 6 hours
         
+        # HTTP transport: live requests, or a record/replay cassette (PROVIDER_CASSETTE)
+        self.cassette = get_cassette()
+        self.http = CassetteHTTP(self.cassette) if self.cassette is not None else requests
+    
+    def _credential(self, name: str) -> Optional[str]:
+        """API key by name; replaying a cassette needs none, so the redacted value stands in"""
+        value = self.api_keys.get(name)
+        if not value and self.cassette is not None and self.cassette.mode == Cassette.REPLAY:
+            return REDACTED
+        return value
+        
     def fetch_glassdoor_salaries(self, job_title: str, location: str) -> List[Dict]:
         """Fetch salary data from Glassdoor API"""
         api_key = self.api_keys.get('glassdoor_api_key')
@@ -73,7 +90,7 @@ class SalaryDataCollector:
     
     def fetch_payscale_data(self, job_title: str, location: str) -> Dict[str, Any]:
         """Fetch salary data from PayScale API"""
-        api_key = self.api_keys.get('payscale_api_key')
+        api_key = self._credential('payscale_api_key')
         
         if not api_key:
             return self._get_market_estimate(job_title, location)
@@ -88,7 +105,7 @@ class SalaryDataCollector:
         }
         
         try:
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.http.get(url, params=params, headers=self.headers, timeout=10)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -438,8 +455,10 @@ class SalaryPredictor:
         # Create skill features
         if 'skills' in df.columns:
             df_processed['skill_count'] = df['skills'].str.count(',') + 1
-            df_processed['has_ml_skills'] = df['skills'].str.contains('Machine Learning|TensorFlow|PyTorch', case=False).astype(int)
-            df_processed['has_cloud_skills'] = df['skills'].str.contains('AWS|Azure|GCP', case=False).astype(int)
+            # Python-int bitsets (wider than int64), so test the masks per row
+            skill_bits = df['skills'].fillna('').map(skill_taxonomy.encode)
+            df_processed['has_ml_skills'] = skill_bits.map(lambda bits: int(bool(bits & ML_SKILLS_MASK)))
+            df_processed['has_cloud_skills'] = skill_bits.map(lambda bits: int(bool(bits & CLOUD_SKILLS_MASK)))
             df_processed = df_processed.drop('skills', axis=1)
         else:
             df_processed['skill_count'] = 3  # Default
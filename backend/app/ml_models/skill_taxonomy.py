@@ -0,0 +1,150 @@
+"""
+Skill Taxonomy
+Description: Canonical skills with synonyms compiled to integer IDs, so resumes, jobs and profiles compare as bitsets
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Union
+
+# category -> canonical skill -> synonyms; declaration order fixes the skill IDs
+SKILLS: Dict[str, Dict[str, List[str]]] = {
+    'programming': {
+        'python': [], 'java': [], 'javascript': ['js', 'ecmascript'], 'typescript': [],
+        'c++': ['cpp'], 'c#': ['csharp', 'c sharp'], '.net': ['dotnet', 'asp.net'], 'ruby': [],
+        'go': ['golang'], 'rust': [], 'php': [], 'swift': [], 'kotlin': [], 'scala': [], 'r': [],
+        'matlab': [], 'sql': [], 'nosql': [], 'graphql': [], 'android': [], 'ios': []
+    },
+    'web_development': {
+        'react': ['reactjs', 'react.js'], 'angular': ['angularjs', 'angular.js'],
+        'vue': ['vuejs', 'vue.js'], 'svelte': [], 'node.js': ['nodejs', 'node js'],
+        'express': ['expressjs', 'express.js'], 'django': [], 'flask': [], 'fastapi': [],
+        'spring boot': ['spring', 'spring framework'], 'hibernate': [], 'html': ['html5'],
+        'css': ['css3'], 'bootstrap': [], 'tailwind': ['tailwindcss', 'tailwind css'],
+        'sass': ['scss'], 'webpack': [], 'vite': [], 'npm': [], 'yarn': [],
+        'rest api': ['rest apis', 'restful', 'restful api', 'restful apis'],
+        'microservices': ['microservice']
+    },
+    'data_science': {
+        'machine learning': ['ml'], 'deep learning': [], 'artificial intelligence': ['ai'],
+        'data science': [], 'tensorflow': [], 'pytorch': ['torch'], 'keras': [],
+        'scikit-learn': ['sklearn', 'scikit learn'], 'xgboost': [], 'pandas': [], 'numpy': [],
+        'matplotlib': [], 'seaborn': [], 'plotly': [], 'jupyter': [], 'anaconda': [],
+        'statistical analysis': [], 'data visualization': [], 'big data': [], 'hadoop': [],
+        'spark': ['apache spark'], 'pyspark': [], 'tableau': [], 'power bi': ['powerbi'],
+        'excel': ['ms excel', 'microsoft excel']
+    },
+    'cloud_devops': {
+        'aws': ['amazon web services'], 'azure': ['microsoft azure'],
+        'gcp': ['google cloud', 'google cloud platform'], 'docker': [], 'kubernetes': ['k8s'],
+        'jenkins': [], 'git': [], 'github': [], 'gitlab': [], 'terraform': [], 'ansible': [],
+        'ci/cd': ['cicd', 'ci-cd', 'continuous integration'], 'devops': [], 'linux': [],
+        'bash': [], 'shell scripting': [], 'nginx': [], 'apache': []
+    },
+    'databases': {
+        'mysql': [], 'postgresql': ['postgres', 'psql'], 'mongodb': ['mongo'], 'redis': [],
+        'elasticsearch': ['elastic search'], 'oracle': [], 'sqlite': [], 'cassandra': [],
+        'dynamodb': [], 'cosmosdb': [], 'snowflake': []
+    },
+    'soft_skills': {
+        'leadership': [], 'communication': [], 'teamwork': ['team work'], 'collaboration': [],
+        'problem solving': [], 'project management': [], 'analytical thinking': [],
+        'creativity': [], 'adaptability': [], 'time management': [], 'critical thinking': [],
+        'decision making': [], 'negotiation': [], 'agile': [], 'scrum': []
+    }
+}
+
+_WHITESPACE = re.compile(r'\s')
+
+class SkillTaxonomy:
+    """Skills numbered 0..n-1; a set of skills is an int with those bits set
+
+    Extraction is one compiled alternation over every synonym (longest first), and
+    multi-word skills also match hyphenated, underscored or run-together spellings.
+    Overlap between two bitsets is ``(a & b).bit_count()``.
+    """
+
+    def __init__(self, skills: Dict[str, Dict[str, List[str]]] = SKILLS):
+        self.names: List[str] = []
+        self.categories: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._category_masks: Dict[str, int] = {}
+
+        for category, entries in skills.items():
+            self._category_masks[category] = 0
+            for name, synonyms in entries.items():
+                skill_id = len(self.names)
+                self.names.append(name)
+                self.categories.append(category)
+                self._category_masks[category] |= 1 << skill_id
+                for alias in [name] + synonyms:
+                    for variant in {alias, alias.replace(' ', ''), alias.replace(' ', '-'), alias.replace(' ', '_')}:
+                        self._ids.setdefault(variant, skill_id)
+
+        aliases = sorted({alias for entries in skills.values() for name, synonyms in entries.items()
+                          for alias in [name] + synonyms}, key=len, reverse=True)
+        alternation = '|'.join(re.escape(alias).replace(r'\ ', r'[\s_-]?') for alias in aliases)
+        self._pattern = re.compile(r'(?<![\w.+#])(?:' + alternation + r')(?![\w+#&])', re.IGNORECASE)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_of(self, skill: str) -> Optional[int]:
+        """ID of a canonical name or synonym, or None for an unknown skill"""
+        return self._ids.get(_WHITESPACE.sub(' ', skill.strip().lower()))
+
+    def extract_ids(self, text: str) -> List[int]:
+        """Skill IDs mentioned in free text, in order of first mention"""
+        found = {}
+        for match in self._pattern.finditer(text or ''):
+            skill_id = self.id_of(match.group(0))
+            if skill_id is not None:
+                found.setdefault(skill_id, None)
+        return list(found)
+
+    def encode(self, skills: Union[str, Iterable[str]]) -> int:
+        """Bitset of the skills in a text or a list of skill strings"""
+        text = skills if isinstance(skills, str) else ', '.join(skills)
+        bits = 0
+        for skill_id in self.extract_ids(text):
+            bits |= 1 << skill_id
+        return bits
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Bitset of known skill names or synonyms (no free-text matching)"""
+        bits = 0
+        for skill in skills:
+            skill_id = self.id_of(skill)
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def category_mask(self, category: str) -> int:
+        return self._category_masks.get(category, 0)
+
+    def decode(self, bits: int) -> List[str]:
+        """Canonical names of the set bits, in ID order"""
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self.names[low.bit_length() - 1])
+            bits ^= low
+        return names
+
+    def by_category(self, bits: int) -> Dict[str, List[str]]:
+        """Canonical names grouped by category; every category is present"""
+        return {category: self.decode(bits & mask) for category, mask in self._category_masks.items()}
+
+    def keywords_by_category(self) -> Dict[str, List[str]]:
+        return self.by_category((1 << len(self.names)) - 1)
+
+    @staticmethod
+    def overlap(a: int, b: int) -> int:
+        return (a & b).bit_count()
+
+    @staticmethod
+    def jaccard(a: int, b: int) -> float:
+        union = (a | b).bit_count()
+        return (a & b).bit_count() / union if union else 0.0
+
+# Shared by the resume, chat, salary and job-matching code
+skill_taxonomy = SkillTaxonomy()
@@ -3,16 +3,12 @@ from bson import ObjectId
 from datetime import datetime, timezone
 import traceback
 import logging
-from app.services.chat_service import ChatService
+from app.services.registry import get_chat_service
 
 bp = Blueprint('chat', __name__, url_prefix='/api/chat')
 
 logger = logging.getLogger(__name__)
 
-# Initialize ML-powered ChatService
-# Instantiated globally to avoid reloading models on every request
-chat_service_instance = None
-
 @bp.route('/message', methods=['POST'])
 def send_message():
     """Handle chat messages from the frontend - works without MongoDB"""
@@ -31,13 +27,8 @@ def send_message():
         if not user_message:
             return jsonify({'error': 'Message is required'}), 400
         
-        # Instantiate service lazily if not done yet
-        global chat_service_instance
-        if chat_service_instance is None:
-            chat_service_instance = ChatService()
-            
-        # Use ML-powered ChatService for intent detection and response generation
-        response_data = chat_service_instance.process_message(
+        # Use the shared ML-powered ChatService (loaded once per process)
+        response_data = get_chat_service().process_message(
             user_message, 
             user_id=user_id if user_id != 'anonymous' else None
         )
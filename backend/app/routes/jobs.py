@@ -1,13 +1,10 @@
 from datetime import datetime
 from flask import Blueprint, request, jsonify, current_app
-from app.ml_models.job_matcher import SyncJobFetcher
+from app.services.registry import get_sync_job_fetcher
 from bson import ObjectId
 
 bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
 
-# Initialize the sync fetcher
-sync_fetcher = SyncJobFetcher()
-
 @bp.route('/recommendations', methods=['POST'])
 def get_job_recommendations():
     try:
@@ -29,7 +26,9 @@ def get_job_recommendations():
         }
         
         # Use synchronous method
+        sync_fetcher = get_sync_job_fetcher()
         recommendations = sync_fetcher.recommend_jobs_sync(user_profile)
+        fetch_report = sync_fetcher.get_recommendation_fetch_report(user_profile)
         
         # Save recommendations to MongoDB
         job_recommendations_collection = db.job_recommendations
@@ -49,7 +48,10 @@ def get_job_recommendations():
             }
             job_recommendations_collection.insert_one(job_rec)
         
-        return jsonify({'recommendations': recommendations})
+        return jsonify({
+            'recommendations': recommendations,
+            'sources_included': fetch_report.get('sources_included', [])
+        })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -62,9 +64,15 @@ def search_jobs():
         location = data.get('location', '')
         
         # Use synchronous method
+        sync_fetcher = get_sync_job_fetcher()
         jobs = sync_fetcher.fetch_jobs_sync(query, location, limit=20)
+        fetch_report = sync_fetcher.get_fetch_report(query, location)
         
-        return jsonify({'jobs': jobs, 'count': len(jobs)})
+        return jsonify({
+            'jobs': jobs,
+            'count': len(jobs),
+            'sources_included': fetch_report.get('sources_included', [])
+        })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
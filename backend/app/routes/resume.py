@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify, current_app
-from app.ml_models.resume_optimizer import ResumeOptimizer
+from app.services.registry import get_resume_optimizer
 from app.services.resume_builder import ResumeBuilder
 from bson import ObjectId
 import base64
@@ -7,7 +7,6 @@ from io import BytesIO
 
 bp = Blueprint('resume', __name__, url_prefix='/api/resume')
 
-resume_optimizer = ResumeOptimizer()
 resume_builder = ResumeBuilder()
 
 @bp.route('/analyze', methods=['POST'])
@@ -23,7 +22,7 @@ def analyze_resume():
             return jsonify({'error': 'Resume text is required'}), 400
             
         # Analyze resume using ML model
-        analysis = resume_optimizer.analyze_resume(resume_text, job_description)
+        analysis = get_resume_optimizer().analyze_resume(resume_text, job_description)
         
         # Get additional insights
         ats_score = resume_builder.calculate_ats_score(resume_text)
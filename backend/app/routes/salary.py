@@ -1,13 +1,10 @@
 from flask import Blueprint, request, jsonify, current_app
-from app.ml_models.salary_predictor import SalaryPredictor, SalaryDataCollector, MarketAnalyzer
+from app.services.registry import get_salary_predictor
 from app.services.salary_data import SalaryDataService
 from bson import ObjectId
 
 bp = Blueprint('salary', __name__, url_prefix='/api/salary')
 
-data_collector = SalaryDataCollector()
-market_analyzer = MarketAnalyzer(data_collector)
-salary_predictor = SalaryPredictor(data_collector, market_analyzer)
 salary_data_service = SalaryDataService()
 
 @bp.route('/predict', methods=['POST'])
@@ -19,7 +16,7 @@ def predict_salary():
         user_id = data.get('user_id')
         
         # Get ML prediction
-        prediction = salary_predictor.predict_salary(user_profile)
+        prediction = get_salary_predictor().predict_salary(user_profile)
         
         # Get market data
         market_data = salary_data_service.get_market_data(
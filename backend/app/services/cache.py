@@ -0,0 +1,264 @@
+"""
+Bounded Cache
+Description: Thread-safe LRU cache with TTL expiry, stale-while-revalidate grace and entry/byte budgets
+"""
+
+import sys
+import time
+import logging
+import threading
+import numpy as np
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+def estimate_size(value: Any) -> int:
+    """Rough size in bytes of a cached value (numpy buffers, strings and plain containers)"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+class BoundedCache:
+    """Thread-safe LRU cache with TTL expiry, entry/byte budgets and hit/miss/eviction counters"""
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 ttl: Union[timedelta, float, None] = None,
+                 sizeof: Callable[[Any], int] = estimate_size,
+                 sweep_interval: float = 60.0,
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+                 stale_grace: Union[timedelta, float, None] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # Expired entries are kept this long for get_with_staleness() before being dropped
+        self.stale_grace = stale_grace
+        self.sizeof = sizeof
+        self.sweep_interval = sweep_interval
+        # Called with (key, value) whenever an entry is evicted or expires
+        self.on_evict = on_evict
+
+        # key -> (value, expires_at, size); ordered from least to most recently used
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._last_sweep = time.monotonic()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+        self.oversized = 0
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: Union[timedelta, float, None]):
+        self._ttl = value.total_seconds() if isinstance(value, timedelta) else value
+
+    @property
+    def stale_grace(self) -> float:
+        return self._stale_grace
+
+    @stale_grace.setter
+    def stale_grace(self, value: Union[timedelta, float, None]):
+        value = value.total_seconds() if isinstance(value, timedelta) else value
+        self._stale_grace = value or 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry, time.monotonic())
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of the stored keys, least recently used first"""
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    @staticmethod
+    def _is_expired(entry: tuple, now: float) -> bool:
+        expires_at = entry[1]
+        return expires_at is not None and now >= expires_at
+
+    def _is_dead(self, entry: tuple, now: float) -> bool:
+        """Expired and past the stale grace window"""
+        expires_at = entry[1]
+        return expires_at is not None and now >= expires_at + self._stale_grace
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a live value, refreshing its LRU position"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            now = time.monotonic()
+            if self._is_expired(entry, now):
+                if self._is_dead(entry, now):
+                    self._discard(key)
+                    self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_with_staleness(self, key: Hashable) -> Tuple[Any, bool]:
+        """Get ``(value, is_stale)``; expired values within the grace window come back as stale
+
+        Returns ``(None, False)`` on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+
+            now = time.monotonic()
+            if self._is_dead(entry, now):
+                self._discard(key)
+                self.expirations += 1
+                self.misses += 1
+                return None, False
+
+            self._entries.move_to_end(key)
+            if self._is_expired(entry, now):
+                self.stale_hits += 1
+                return entry[0], True
+
+            self.hits += 1
+            return entry[0], False
+
+    def peek(self, key: Hashable) -> Tuple[Any, bool]:
+        """Like get_with_staleness() but without touching LRU order or counters"""
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is None or self._is_dead(entry, now):
+                return None, False
+            return entry[0], self._is_expired(entry, now)
+
+    def ttl_remaining(self, key: Hashable) -> Optional[float]:
+        """Seconds until ``key`` expires (negative once stale), or None if absent or never expiring"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] is None:
+                return None
+            return entry[1] - time.monotonic()
+
+    def set(self, key: Hashable, value: Any, ttl: Union[timedelta, float, None] = None):
+        """Store a value, evicting least recently used entries to stay within budget"""
+        if isinstance(ttl, timedelta):
+            ttl = ttl.total_seconds()
+        ttl = self._ttl if ttl is None else ttl
+
+        size = self.sizeof(key) + self.sizeof(value)
+        now = time.monotonic()
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # A single value larger than the whole budget is never cached
+            if self.max_bytes is not None and size > self.max_bytes:
+                self.oversized += 1
+                logger.warning(f"Not caching '{key}': {size} bytes exceeds the {self.max_bytes}-byte budget")
+                return
+
+            expires_at = now + ttl if ttl is not None else None
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+
+            self._maybe_sweep(now)
+            self._enforce_limits()
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._remove(key)
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _discard(self, key: Hashable):
+        """Remove an entry the cache dropped on its own and notify the eviction callback"""
+        value = self._entries[key][0]
+        self._remove(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _enforce_limits(self):
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries) or
+            (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            self._discard(key)
+            self.evictions += 1
+
+    def _maybe_sweep(self, now: float):
+        if now - self._last_sweep >= self.sweep_interval:
+            self._sweep(now)
+
+    def _sweep(self, now: float) -> int:
+        expired = [key for key, entry in self._entries.items() if self._is_dead(entry, now)]
+        for key in expired:
+            self._discard(key)
+        self.expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
+
+    def sweep(self) -> int:
+        """Drop every entry past its TTL and stale grace; returns the number removed"""
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and current usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self._ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'stale_hits': self.stale_hits,
+                'oversized': self.oversized,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
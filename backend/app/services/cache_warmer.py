@@ -0,0 +1,186 @@
+"""
+Job Cache Warmer
+Description: Tracks observed job searches and periodically pre-fetches the most frequent ones
+"""
+
+import os
+import asyncio
+import logging
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from app.services.event_loop import BackgroundEventLoop, get_background_loop
+
+logger = logging.getLogger(__name__)
+
+class QueryLog:
+    """Thread-safe counts of observed (keywords, location) searches
+
+    ``decay`` scales every count down once per warming cycle, so the ranking follows
+    what users searched recently rather than since process start.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._counts: Counter = Counter()
+        self._queries: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(keywords: str, location: str) -> Tuple[str, str]:
+        return (keywords or '').strip().lower(), (location or '').strip().lower()
+
+    def record(self, keywords: str, location: str, weight: float = 1.0):
+        key = self._normalize(keywords, location)
+        if not key[0]:
+            return
+        with self._lock:
+            self._counts[key] += weight
+            self._queries.setdefault(key, (keywords, location))
+            if len(self._counts) > self.max_entries:
+                # Drop the rarest quarter rather than growing without bound
+                for rare, _ in self._counts.most_common()[-(self.max_entries // 4):]:
+                    del self._counts[rare]
+                    self._queries.pop(rare, None)
+
+    def decay(self, factor: float = 0.5, floor: float = 0.05):
+        with self._lock:
+            for key in list(self._counts):
+                self._counts[key] *= factor
+                if self._counts[key] < floor:
+                    del self._counts[key]
+                    self._queries.pop(key, None)
+
+    def top(self, n: int) -> List[Tuple[Tuple[str, str], float]]:
+        """Most frequent searches as ((keywords, location), count), in their original spelling"""
+        with self._lock:
+            return [(self._queries[key], count) for key, count in self._counts.most_common(n)]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+def default_seed_queries() -> List[Tuple[str, str]]:
+    """trending_skills x popular_locations from JobScraper, used before any traffic is seen"""
+    try:
+        from app.services.job_scraper import JobScraper
+        scraper = JobScraper()
+        skills, locations = scraper.get_trending_skills(), scraper.get_popular_locations()
+    except ImportError as e:
+        logger.warning(f"JobScraper unavailable for cache-warming seeds: {e}")
+        return []
+
+    # Interleave so the first seeds cover many skills and cities
+    return [(skill, location) for rank in range(max(len(skills), len(locations)))
+            for skill, location in zip(skills[rank:] + skills[:rank], locations)]
+
+class CacheWarmer:
+    """Periodically pre-fetch and pre-embed the most frequent searches
+
+    Each cycle ranks observed queries (topped up with seed queries), and refreshes those
+    whose cached results are missing or expire within ``refresh_margin``. Warming is
+    bounded three ways so live traffic always wins: at most ``concurrency`` warm fetches
+    run at once, at most ``max_fetches_per_cycle`` per cycle, and a fetch only starts
+    while every provider's rate limiter still holds ``reserve_tokens`` tokens.
+    """
+
+    def __init__(self, matcher, query_log: Optional[QueryLog] = None,
+                 seed_queries: Optional[List[Tuple[str, str]]] = None,
+                 loop: Optional[BackgroundEventLoop] = None,
+                 interval: Optional[float] = None, top_n: Optional[int] = None,
+                 concurrency: Optional[int] = None, max_fetches_per_cycle: Optional[int] = None,
+                 reserve_tokens: Optional[float] = None, refresh_margin: Optional[float] = None):
+        self.matcher = matcher
+        self.query_log = query_log if query_log is not None else matcher.query_log
+        self.seed_queries = seed_queries if seed_queries is not None else default_seed_queries()
+        self.loop = loop or get_background_loop()
+
+        self.interval = interval if interval is not None else float(os.getenv('CACHE_WARM_INTERVAL_MINUTES', 15)) * 60
+        self.top_n = top_n or int(os.getenv('CACHE_WARM_TOP_N', 20))
+        self.concurrency = concurrency or int(os.getenv('CACHE_WARM_CONCURRENCY', 2))
+        self.max_fetches_per_cycle = max_fetches_per_cycle or int(os.getenv('CACHE_WARM_MAX_FETCHES', 10))
+        self.reserve_tokens = reserve_tokens if reserve_tokens is not None else float(os.getenv('CACHE_WARM_RESERVE_TOKENS', 3))
+        self.refresh_margin = refresh_margin if refresh_margin is not None else float(os.getenv('CACHE_WARM_REFRESH_MARGIN_MINUTES', 10)) * 60
+
+        self._future = None
+        self.cycles = 0
+        self.warmed = 0
+        self.skipped_for_quota = 0
+
+    def candidates(self) -> List[Tuple[str, str]]:
+        """Searches to keep warm: most frequent first, then seeds, without duplicates"""
+        ranked = [query for query, _ in self.query_log.top(self.top_n)]
+        seen = {self.matcher._cache_key(*query) for query in ranked}
+        for query in self.seed_queries:
+            if len(ranked) >= self.top_n:
+                break
+            key = self.matcher._cache_key(*query)
+            if key not in seen:
+                seen.add(key)
+                ranked.append(query)
+        return ranked
+
+    def _needs_refresh(self, keywords: str, location: str) -> bool:
+        cache_key = self.matcher._cache_key(keywords, location)
+        if cache_key in self.matcher.inflight_fetches:
+            return False
+        remaining = self.matcher.job_cache.ttl_remaining(cache_key)
+        return remaining is None or remaining < self.refresh_margin
+
+    def _quota_available(self) -> bool:
+        limiters = self.matcher.api_client.rate_limiters.values()
+        return all(limiter.available() >= self.reserve_tokens for limiter in limiters)
+
+    async def warm_once(self) -> int:
+        """Run one warming cycle; returns how many searches were refreshed"""
+        due = [query for query in self.candidates() if self._needs_refresh(*query)]
+        due = due[:self.max_fetches_per_cycle]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        warmed = 0
+
+        async def warm(keywords: str, location: str):
+            nonlocal warmed
+            async with semaphore:
+                if not self._quota_available():
+                    self.skipped_for_quota += 1
+                    return
+                try:
+                    jobs = await self.matcher.warm_cache(keywords, location)
+                    warmed += 1 if jobs else 0
+                except Exception as e:
+                    logger.error(f"Cache warming failed for '{keywords}' in '{location}': {e}")
+
+        await asyncio.gather(*(warm(*query) for query in due))
+
+        self.cycles += 1
+        self.warmed += warmed
+        self.query_log.decay()
+        logger.info(f"Cache warming cycle {self.cycles}: refreshed {warmed} of {len(due)} due searches")
+        return warmed
+
+    async def _run_forever(self):
+        while True:
+            try:
+                await self.warm_once()
+            except Exception as e:
+                logger.error(f"Cache warming cycle failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start warming on the background loop (idempotent)"""
+        if self._future is None or self._future.done():
+            self._future = self.loop.submit(self._run_forever())
+            logger.info(f"Started cache warmer: every {self.interval / 60:.0f} min, top {self.top_n} searches")
+
+    def stop(self):
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'running': self._future is not None and not self._future.done(),
+            'cycles': self.cycles,
+            'warmed': self.warmed,
+            'skipped_for_quota': self.skipped_for_quota,
+            'tracked_queries': len(self.query_log)
+        }
@@ -0,0 +1,317 @@
+"""
+Provider Traffic Cassette
+Description: Records provider HTTP responses to disk and replays them offline for deterministic load tests
+"""
+
+import os
+import json
+import gzip
+import time
+import atexit
+import random
+import asyncio
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import aiohttp
+import requests
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+logger = logging.getLogger(__name__)
+
+# Query parameters whose values never reach the cassette file or its keys
+SECRET_PARAMS = {'app_id', 'app_key', 'api_key', 'apikey', 'key', 'token', 'access_token'}
+# Response headers replayed; the client code reads nothing else
+RECORDED_HEADERS = ('Content-Type', 'Retry-After')
+REDACTED = '<secret>'
+
+class CassetteMiss(LookupError):
+    """Replay found no recorded response for a request"""
+
+class Cassette:
+    """Provider HTTP traffic recorded to, or replayed from, one gzip-compressed JSON file
+
+    Requests are keyed by a normalised form: method, URL path (host and port ignored,
+    so a recording made against the local stand-in replays anywhere), sorted query
+    parameters and JSON body, with API keys redacted. Up to ``max_responses_per_key``
+    responses are kept per key and replayed round-robin. Replay waits either the
+    recorded response time times ``latency_scale`` or, with ``latency_ms``, a seeded
+    normal(latency_ms, jitter_ms) delay, so offline load tests stay deterministic.
+    """
+
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+    def __init__(self, path, mode: str = REPLAY, latency_ms: Optional[float] = None,
+                 jitter_ms: float = 0.0, latency_scale: float = 1.0,
+                 max_responses_per_key: int = 5, seed: int = 7):
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"Unknown cassette mode '{mode}'; expected '{self.RECORD}' or '{self.REPLAY}'")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.latency_scale = latency_scale
+        self.max_responses_per_key = max_responses_per_key
+        self.rng = random.Random(seed)
+
+        self._interactions: Dict[str, Dict[str, Any]] = {}
+        self._replay_counts: Dict[str, int] = {}
+        self._secrets: set = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+        if self.path.exists():
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                self._interactions = json.load(f).get('interactions', {})
+            logger.info(f"Loaded {len(self._interactions)} recorded requests from {self.path}")
+        elif mode == self.REPLAY:
+            raise FileNotFoundError(f"No cassette at {self.path}; record one first")
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def add_secrets(self, values: Iterable[Optional[str]]):
+        """Values (e.g. an API key in a URL path) to redact from request keys"""
+        with self._lock:
+            self._secrets.update(value for value in values if value)
+
+    def _redact(self, text: str) -> str:
+        for secret in self._secrets:
+            text = text.replace(secret, REDACTED)
+        return text
+
+    def normalize(self, method: str, url: str, params: Optional[Dict] = None,
+                  json_data: Any = None) -> Dict[str, Any]:
+        parts = urlsplit(str(url))
+        query = parse_qsl(parts.query, keep_blank_values=True) + [(str(k), str(v)) for k, v in (params or {}).items()]
+        return {
+            'method': method.upper(),
+            'path': self._redact(parts.path.rstrip('/')),
+            'params': sorted((name, REDACTED if name.lower() in SECRET_PARAMS else self._redact(value))
+                             for name, value in query),
+            'json': json.loads(self._redact(json.dumps(json_data, sort_keys=True))) if json_data is not None else None
+        }
+
+    @staticmethod
+    def key(request: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def record(self, request: Dict[str, Any], status: int, headers, body: str, elapsed: float):
+        response = {
+            'status': status,
+            'headers': {name: headers[name] for name in RECORDED_HEADERS if name in headers},
+            'body': body,
+            'elapsed_ms': round(elapsed * 1000, 2)
+        }
+        with self._lock:
+            entry = self._interactions.setdefault(self.key(request), {'request': request, 'responses': []})
+            if len(entry['responses']) < self.max_responses_per_key:
+                entry['responses'].append(response)
+                self.recorded += 1
+                self._dirty = True
+
+    def lookup(self, request: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        """Next recorded response for a request and how long to wait before returning it"""
+        key = self.key(request)
+        with self._lock:
+            entry = self._interactions.get(key)
+            if entry is None:
+                self.misses += 1
+                raise CassetteMiss(f"No recorded response for {request['method']} {request['path']} {request['params']}")
+            index = self._replay_counts.get(key, 0)
+            self._replay_counts[key] = index + 1
+            self.hits += 1
+            response = entry['responses'][index % len(entry['responses'])]
+
+            if self.latency_ms is not None:
+                delay = max(0.0, self.rng.gauss(self.latency_ms, self.jitter_ms)) / 1000
+            else:
+                delay = response['elapsed_ms'] * self.latency_scale / 1000
+        return response, delay
+
+    def save(self):
+        """Write recorded interactions atomically (no-op when nothing new was recorded)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            document = {'version': 1, 'interactions': self._interactions}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                    f.write(json.dumps(document, sort_keys=True).encode('utf-8'))
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            self._dirty = False
+        logger.info(f"Saved {len(self._interactions)} recorded requests to {self.path}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'mode': self.mode, 'path': str(self.path), 'requests': len(self._interactions),
+                    'hits': self.hits, 'misses': self.misses, 'recorded': self.recorded}
+
+class CassetteResponse:
+    """Recorded response with the parts of the aiohttp and requests response APIs the clients use"""
+
+    def __init__(self, method: str, url: str, response: Dict[str, Any]):
+        self.method = method
+        self.url = str(url)
+        self.status = self.status_code = response['status']
+        self.headers = CIMultiDict(response['headers'])
+        self._body = response['body']
+
+    @property
+    def text(self) -> str:
+        return self._body
+
+    def _json(self) -> Any:
+        return json.loads(self._body) if self._body else None
+
+    def json(self, **kwargs) -> Any:
+        return self._json()
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise requests.HTTPError(f"HTTP {self.status} for {self.url}", response=self)
+
+class _AsyncCassetteResponse(CassetteResponse):
+    async def json(self, **kwargs) -> Any:
+        return self._json()
+
+    async def text(self) -> str:
+        return self._body
+
+    def raise_for_status(self):
+        if self.status < 400:
+            return
+        url = URL(self.url)
+        raise aiohttp.ClientResponseError(
+            aiohttp.RequestInfo(url, self.method, CIMultiDictProxy(CIMultiDict()), url),
+            (), status=self.status, message=f"HTTP {self.status}", headers=self.headers
+        )
+
+class _CassetteRequest:
+    """``async with session.get(...) as response`` for a CassetteSession"""
+
+    def __init__(self, session: 'CassetteSession', method: str, url: str, params, json_data, kwargs):
+        self.session = session
+        self.args = (method, url, params, json_data, kwargs)
+
+    async def __aenter__(self) -> _AsyncCassetteResponse:
+        return await self.session._request(*self.args)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+class CassetteSession:
+    """Stand-in for ``aiohttp.ClientSession.get/post`` that records through, or replays from, a cassette"""
+
+    def __init__(self, cassette: Cassette, session: Optional[aiohttp.ClientSession] = None):
+        if cassette.mode == Cassette.RECORD and session is None:
+            raise ValueError("Recording needs a real aiohttp session")
+        self.cassette = cassette
+        self.session = session
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed or (self.session is not None and self.session.closed)
+
+    async def close(self):
+        self._closed = True
+        if self.session is not None:
+            await self.session.close()
+
+    def get(self, url, params=None, **kwargs) -> _CassetteRequest:
+        return _CassetteRequest(self, 'GET', url, params, None, kwargs)
+
+    def post(self, url, json=None, **kwargs) -> _CassetteRequest:
+        return _CassetteRequest(self, 'POST', url, None, json, kwargs)
+
+    async def _request(self, method, url, params, json_data, kwargs) -> _AsyncCassetteResponse:
+        request = self.cassette.normalize(method, url, params, json_data)
+
+        if self.cassette.mode == Cassette.REPLAY:
+            response, delay = self.cassette.lookup(request)
+            if delay:
+                await asyncio.sleep(delay)
+            return _AsyncCassetteResponse(method, url, response)
+
+        started = time.perf_counter()
+        async with self.session.request(method, url, params=params, json=json_data, **kwargs) as live:
+            body = await live.text()
+            status, headers = live.status, live.headers
+        self.cassette.record(request, status, headers, body, time.perf_counter() - started)
+        return _AsyncCassetteResponse(method, url, {'status': status, 'body': body,
+                                                    'headers': {name: headers[name] for name in RECORDED_HEADERS if name in headers}})
+
+class CassetteHTTP:
+    """Stand-in for the ``requests`` module's ``get``/``post`` with the same cassette behaviour"""
+
+    def __init__(self, cassette: Cassette, session=requests):
+        self.cassette = cassette
+        self.session = session
+
+    def get(self, url, params=None, **kwargs) -> CassetteResponse:
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url, json=None, **kwargs) -> CassetteResponse:
+        return self.request('POST', url, json=json, **kwargs)
+
+    def request(self, method, url, params=None, json=None, **kwargs) -> CassetteResponse:
+        request = self.cassette.normalize(method, url, params, json)
+
+        if self.cassette.mode == Cassette.REPLAY:
+            response, delay = self.cassette.lookup(request)
+            if delay:
+                time.sleep(delay)
+            return CassetteResponse(method, url, response)
+
+        started = time.perf_counter()
+        live = self.session.request(method, url, params=params, json=json, **kwargs)
+        self.cassette.record(request, live.status_code, live.headers, live.text, time.perf_counter() - started)
+        return CassetteResponse(method, url, {'status': live.status_code, 'body': live.text,
+                                              'headers': {name: live.headers[name] for name in RECORDED_HEADERS if name in live.headers}})
+
+_shared_cassettes: Dict[str, Cassette] = {}
+_shared_lock = threading.Lock()
+
+def get_cassette() -> Optional[Cassette]:
+    """Process-wide cassette from PROVIDER_CASSETTE / PROVIDER_CASSETTE_MODE, or None
+
+    Every client opening the same path shares one instance, which is saved at exit
+    when recording.
+    """
+    path = os.getenv('PROVIDER_CASSETTE')
+    if not path:
+        return None
+
+    with _shared_lock:
+        cassette = _shared_cassettes.get(path)
+        if cassette is None:
+            latency_ms = os.getenv('PROVIDER_CASSETTE_LATENCY_MS')
+            cassette = Cassette(
+                path,
+                mode=os.getenv('PROVIDER_CASSETTE_MODE', Cassette.REPLAY),
+                latency_ms=float(latency_ms) if latency_ms else None,
+                jitter_ms=float(os.getenv('PROVIDER_CASSETTE_JITTER_MS', 0)),
+                latency_scale=float(os.getenv('PROVIDER_CASSETTE_LATENCY_SCALE', 1))
+            )
+            if cassette.mode == Cassette.RECORD:
+                atexit.register(cassette.save)
+            _shared_cassettes[path] = cassette
+            logger.info(f"Using provider cassette {path} in {cassette.mode} mode")
+        return cassette
@@ -1,38 +1,30 @@
 import re
 import json
 from datetime import datetime
-from app.ml_models.job_matcher import RealTimeJobMatcher
-from app.ml_models.resume_optimizer import ResumeOptimizer
-from app.ml_models.salary_predictor import SalaryPredictor, SalaryDataCollector, MarketAnalyzer
+from app.services.registry import registry
+from app.ml_models.resume_optimizer import ensure_nltk_data
+from app.ml_models.skill_taxonomy import skill_taxonomy
 from flask import current_app
 from bson import ObjectId
 
-import nltk
 from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
 from nltk.corpus import stopwords
 
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
-
 class ChatService:
     def __init__(self):
+        ensure_nltk_data()
         self.lemmatizer = WordNetLemmatizer()
         self.stop_words = set(stopwords.words('english'))
         
-        self.job_matcher = RealTimeJobMatcher()
-        self.resume_optimizer = ResumeOptimizer()
+        # Models are shared with the routes through the process-wide registry
+        self.job_matcher = registry.get('job_matcher')
+        self.resume_optimizer = registry.get('resume_optimizer')
         
-        # Initialize salary predictor with required dependencies
-        self.data_collector = SalaryDataCollector()
-        self.market_analyzer = MarketAnalyzer(self.data_collector)
-        self.salary_predictor = SalaryPredictor(self.data_collector, self.market_analyzer)
+        # Salary predictor and its dependencies
+        self.data_collector = registry.get('salary_data_collector')
+        self.market_analyzer = registry.get('market_analyzer')
+        self.salary_predictor = registry.get('salary_predictor')
         
         # Intent patterns for understanding user queries
         self.intent_patterns = {
@@ -205,19 +197,10 @@ class ChatService:
         return None
 
     def _extract_skills(self, message):
-        """Extract skills from message by querying database"""
-        try:
-            db = current_app.db
-            if db:
-                skills = db.jobs.distinct('skills')
-                found_skills = []
-                for skill in skills:
-                    if skill and skill.lower() in message.lower():
-                        found_skills.append(skill)
-                return found_skills if found_skills else None
-        except Exception as e:
-            current_app.logger.error(f"Error extracting skills: {str(e)}")
-        return None
+        """Extract skills from message using the shared skill taxonomy"""
+        # Stored jobs are tagged with the same canonical names, so no database round trip
+        found_skills = skill_taxonomy.decode(skill_taxonomy.encode(message))
+        return found_skills if found_skills else None
 
     def _extract_company(self, message):
         """Extract company name from message by querying database"""
@@ -0,0 +1,112 @@
+"""
+Circuit Breaker
+Description: Failure-rate circuit breaker that stops calling an unhealthy upstream provider for a while
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker for one upstream dependency
+
+    The outcomes of the last ``window_size`` calls are kept. Once at least ``min_calls``
+    have been seen and the failure rate reaches ``failure_rate_threshold`` the circuit
+    opens and every call is rejected immediately. After ``reset_timeout`` seconds it goes
+    half-open and lets ``half_open_max_calls`` probes through: a success closes it again,
+    a failure re-opens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_rate_threshold: float = 0.5, window_size: int = 20,
+                 min_calls: int = 5, reset_timeout: float = 30.0, half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._outcomes = deque(maxlen=window_size)  # True for a failed call
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info(f"Circuit for {self.name} half-open; probing")
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def allow_request(self) -> bool:
+        """True if a call may go ahead; a rejected call costs nothing upstream"""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                logger.info(f"Circuit for {self.name} closed after a successful probe")
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                self._probes_in_flight = 0
+            self._outcomes.append(False)
+
+    def record_failure(self):
+        with self._lock:
+            self._outcomes.append(True)
+            if self._state == self.HALF_OPEN:
+                self._open()
+            elif (self._state == self.CLOSED and len(self._outcomes) >= self.min_calls
+                  and self.failure_rate >= self.failure_rate_threshold):
+                self._open()
+
+    def release(self):
+        """Give back a half-open probe slot for a call that ended without an outcome"""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes_in_flight:
+                self._probes_in_flight -= 1
+
+    def _open(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+        self.times_opened += 1
+        logger.warning(f"Circuit for {self.name} opened (failure rate {self.failure_rate:.0%}); "
+                       f"rejecting calls for {self.reset_timeout:.0f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'failure_rate': round(self.failure_rate, 3),
+            'calls_in_window': len(self._outcomes),
+            'rejected': self.rejected,
+            'times_opened': self.times_opened
+        }
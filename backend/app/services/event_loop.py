@@ -0,0 +1,103 @@
+"""
+Background Event Loop
+Description: Long-lived asyncio loop in a daemon thread for running coroutines from synchronous Flask code
+"""
+
+import os
+import atexit
+import asyncio
+import logging
+import threading
+import concurrent.futures
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+class BackgroundEventLoop:
+    """Event loop running forever in a dedicated daemon thread
+
+    Synchronous callers (Flask views) submit coroutines with ``run``, so connection
+    pools, rate limiters and in-flight request state live on one loop for the whole
+    process instead of a fresh loop per request.
+    """
+
+    def __init__(self, name: str = 'background-event-loop'):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the loop thread if it is not already running"""
+        with self._lock:
+            if self.is_running:
+                return
+
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run_forever, name=self.name, daemon=True)
+            self._thread.start()
+            self._ready.wait()
+
+    def _run_forever(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop and return a thread-safe future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block for its result
+
+        On timeout the coroutine is cancelled and ``concurrent.futures.TimeoutError``
+        is raised.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("BackgroundEventLoop.run() called from its own loop thread")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the loop and join its thread"""
+        with self._lock:
+            if not self.is_running:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
+
+_shared_loop: Optional[BackgroundEventLoop] = None
+_shared_pid: Optional[int] = None
+_shared_lock = threading.Lock()
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Process-wide background loop (recreated after fork, since threads do not survive it)"""
+    global _shared_loop, _shared_pid
+
+    with _shared_lock:
+        if _shared_loop is None or _shared_pid != os.getpid():
+            _shared_loop = BackgroundEventLoop(name='job-matcher-loop')
+            _shared_pid = os.getpid()
+            atexit.register(_shared_loop.stop)
+            logger.info(f"Created background event loop for process {_shared_pid}")
+        return _shared_loop
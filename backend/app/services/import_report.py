@@ -0,0 +1,76 @@
+"""
+Import Cost Report
+Description: Measures module import time to keep worker start-up cheap
+"""
+
+import sys
+import time
+import logging
+import importlib
+import subprocess
+from collections import defaultdict
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+class ImportTimer:
+    """Import modules while recording their wall time and how many modules each pulled in"""
+
+    def __init__(self):
+        self.records: List[Dict] = []
+
+    def import_module(self, name: str):
+        before = set(sys.modules)
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        elapsed = time.perf_counter() - started
+
+        new_modules = set(sys.modules) - before
+        self.records.append({
+            'module': name,
+            'seconds': round(elapsed, 4),
+            'modules_loaded': len(new_modules),
+            'packages_loaded': sorted({m.split('.')[0] for m in new_modules})
+        })
+        return module
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(record['seconds'] for record in self.records)
+
+    def report(self) -> Dict:
+        return {
+            'total_seconds': round(self.total_seconds, 4),
+            'modules': sorted(self.records, key=lambda record: record['seconds'], reverse=True)
+        }
+
+    def log_report(self):
+        logger.info(f"Imported {len(self.records)} modules in {self.total_seconds:.2f}s")
+        for record in sorted(self.records, key=lambda record: record['seconds'], reverse=True):
+            logger.info(f"  {record['module']}: {record['seconds']:.3f}s, {record['modules_loaded']} new modules")
+
+def importtime_report(module: str = 'app', top: int = 25) -> List[Dict]:
+    """Per-package cumulative import cost from ``python -X importtime`` in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True
+    )
+
+    # Lines look like "import time:   self [us] | cumulative | module"; sum self time per package
+    self_us = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            own, _, name = line[len('import time:'):].split('|')
+            self_us[name.strip().split('.')[0]] += int(own)
+        except ValueError:
+            continue
+
+    ranked = sorted(self_us.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [{'package': name, 'seconds': round(us / 1e6, 4)} for name, us in ranked]
+
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else 'app'
+    for entry in importtime_report(target):
+        print(f"{entry['seconds']:8.3f}s  {entry['package']}")
@@ -0,0 +1,113 @@
+"""
+Inference Thread Pool
+Description: Bounded thread pool that runs CPU-heavy model calls off the event loop
+"""
+
+import os
+import time
+import atexit
+import asyncio
+import logging
+import functools
+import threading
+import concurrent.futures
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class InferencePool:
+    """Bounded thread pool for CPU-heavy model calls such as ``SentenceTransformer.encode``
+
+    Coroutines ``await pool.run(fn, ...)`` instead of calling the model inline, so the
+    event loop keeps serving provider fetches while a batch is encoded. torch releases
+    the GIL inside its kernels, so encodes and numpy scoring on different workers really
+    run in parallel; ``torch_threads`` (a process-wide torch setting) bounds how many
+    cores each encode may use.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, torch_threads: Optional[int] = None,
+                 name: str = 'inference'):
+        # Workers mostly wait on the embedding micro-batcher, which does the encoding itself
+        self.max_workers = max_workers or int(os.getenv('INFERENCE_WORKERS', 4))
+        # 0 leaves torch's default (one intra-op thread per core)
+        self.torch_threads = torch_threads if torch_threads is not None else int(os.getenv('TORCH_NUM_THREADS', 0))
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=name,
+            initializer=self._configure_torch
+        )
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def _configure_torch(self):
+        if not self.torch_threads:
+            return
+        try:
+            import torch
+            # Process-wide setting; every worker applying the same value is harmless
+            if torch.get_num_threads() != self.torch_threads:
+                torch.set_num_threads(self.torch_threads)
+        except ImportError:
+            pass
+
+    def _timed(self, fn: Callable, queued_at: float) -> Any:
+        started = time.perf_counter()
+        try:
+            result = fn()
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self.completed += 1
+                self.wait_seconds += started - queued_at
+                self.busy_seconds += finished - started
+        return result
+
+    def submit(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """Queue ``fn(*args, **kwargs)`` on the pool and return a thread-safe future"""
+        with self._lock:
+            self.submitted += 1
+        return self._executor.submit(self._timed, functools.partial(fn, *args, **kwargs), time.perf_counter())
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Await ``fn(*args, **kwargs)`` on the pool without blocking the running loop"""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'torch_threads': self.torch_threads,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'pending': self.submitted - self.completed,
+                'busy_seconds': round(self.busy_seconds, 3),
+                'avg_wait_ms': round(self.wait_seconds / self.completed * 1000, 2) if self.completed else 0.0
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+_shared_pool: Optional[InferencePool] = None
+_shared_pid: Optional[int] = None
+_shared_lock = threading.Lock()
+
+def get_inference_pool() -> InferencePool:
+    """Process-wide inference pool (recreated after fork, since threads do not survive it)"""
+    global _shared_pool, _shared_pid
+
+    with _shared_lock:
+        if _shared_pool is None or _shared_pid != os.getpid():
+            _shared_pool = InferencePool()
+            _shared_pid = os.getpid()
+            atexit.register(_shared_pool.shutdown, False)
+            logger.info(f"Created inference pool with {_shared_pool.max_workers} workers for process {_shared_pid}")
+        return _shared_pool
@@ -0,0 +1,161 @@
+"""
+MongoDB Job Store
+Description: Persists fetched provider jobs in MongoDB so they are shared across workers and restarts
+"""
+
+import time
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from app.ml_models.skill_taxonomy import skill_taxonomy
+
+try:
+    from pymongo import ASCENDING, MongoClient, UpdateOne
+    from pymongo.errors import BulkWriteError, PyMongoError
+    HAS_PYMONGO = True
+except ImportError:
+    HAS_PYMONGO = False
+
+logger = logging.getLogger(__name__)
+
+# Matcher job fields -> stored document fields (names the rest of the app queries)
+_FIELD_MAP = {
+    'job_title': 'title',
+    'company': 'company',
+    'location': 'location',
+    'job_description': 'description',
+    'salary_min': 'salary_min',
+    'salary_max': 'salary_max',
+    'salary_range': 'salary_range',
+    'job_url': 'job_url',
+    'created_date': 'created_date',
+    'contract_type': 'contract_type',
+    'category': 'category',
+    'sources': 'sources',
+    'locations': 'locations',
+    'duplicate_postings': 'duplicate_postings'
+}
+
+def extract_skills(text: str) -> List[str]:
+    """Canonical taxonomy names, so db.jobs.distinct('skills') has something to return"""
+    return skill_taxonomy.decode(skill_taxonomy.encode(text))
+
+class JobStore:
+    """Fetched provider jobs persisted in the MongoDB ``jobs`` collection
+
+    Jobs are upserted in one unordered ``bulk_write`` per fetch, keyed by
+    ``(source, job_id)``, and tagged with the search keys that returned them, so any
+    worker (or a restarted one) can serve a recent search from the database instead of
+    calling the providers again.
+    """
+
+    def __init__(self, collection, retry_after: float = 60.0):
+        self.collection = collection
+        self.retry_after = retry_after
+        self._indexes_ready = False
+        self._unavailable_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        """False for ``retry_after`` seconds after a connection error, so an unreachable
+        database does not add a server-selection timeout to every fetch"""
+        return time.monotonic() >= self._unavailable_until
+
+    def _mark_unavailable(self, error: Exception):
+        self._unavailable_until = time.monotonic() + self.retry_after
+        logger.error(f"MongoDB job store unavailable for {self.retry_after:.0f}s: {error}")
+
+    @classmethod
+    def from_uri(cls, uri: str, server_selection_timeout_ms: int = 2000) -> Optional['JobStore']:
+        if not HAS_PYMONGO:
+            logger.warning("pymongo not installed; fetched jobs will not be persisted")
+            return None
+        client = MongoClient(uri, serverSelectionTimeoutMS=server_selection_timeout_ms)
+        return cls(client.get_database().jobs)
+
+    def ensure_indexes(self):
+        if self._indexes_ready:
+            return
+        self.collection.create_index([('source', ASCENDING), ('job_id', ASCENDING)], unique=True)
+        self.collection.create_index([('search_keys', ASCENDING), ('last_seen', ASCENDING)])
+        self._indexes_ready = True
+
+    @staticmethod
+    def _job_id(job: Dict) -> str:
+        """Provider id, or a content hash for providers that do not send one"""
+        job_id = str(job.get('job_id') or '')
+        if job_id:
+            return job_id
+        identity = '|'.join((job.get(field) or '').lower().strip() for field in ('job_title', 'company', 'location'))
+        return 'sha1:' + hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def to_document(job: Dict) -> Dict[str, Any]:
+        document = {stored: job.get(field) for field, stored in _FIELD_MAP.items() if field in job}
+        document['source'] = job.get('source', '')
+        document['job_id'] = JobStore._job_id(job)
+        document['skills'] = extract_skills(f"{job.get('job_title') or ''} {job.get('job_description') or ''}")
+        return document
+
+    @staticmethod
+    def from_document(document: Dict) -> Dict[str, Any]:
+        job = {field: document.get(stored) for field, stored in _FIELD_MAP.items() if stored in document}
+        job['job_id'] = document.get('job_id', '')
+        job['source'] = document.get('source', '')
+        return job
+
+    def upsert_documents(self, documents: List[Dict], search_key: str) -> Dict[str, int]:
+        """Bulk upsert prepared documents; returns counts of inserted and updated jobs"""
+        if not documents or not self.available:
+            return {'upserted': 0, 'modified': 0}
+
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {'source': document['source'], 'job_id': document['job_id']},
+                {
+                    '$set': {**document, 'last_seen': now},
+                    '$setOnInsert': {'first_seen': now},
+                    '$addToSet': {'search_keys': search_key}
+                },
+                upsert=True
+            )
+            for document in documents
+        ]
+
+        try:
+            self.ensure_indexes()
+            result = self.collection.bulk_write(operations, ordered=False)
+            return {'upserted': result.upserted_count, 'modified': result.modified_count}
+        except BulkWriteError as e:
+            # Unordered: the other operations still went through
+            details = e.details or {}
+            logger.error(f"Job upsert partially failed: {len(details.get('writeErrors', []))} errors")
+            return {'upserted': details.get('nUpserted', 0), 'modified': details.get('nModified', 0)}
+        except PyMongoError as e:
+            self._mark_unavailable(e)
+            return {'upserted': 0, 'modified': 0}
+
+    def upsert_jobs(self, jobs: List[Dict], search_key: str) -> Dict[str, int]:
+        return self.upsert_documents([self.to_document(job) for job in jobs], search_key)
+
+    def find_recent(self, search_key: str, max_age: timedelta, limit: int = 500) -> Tuple[List[Dict], Optional[timedelta]]:
+        """Jobs any worker fetched for this search within ``max_age``, and the age of the newest"""
+        if not self.available:
+            return [], None
+
+        now = datetime.utcnow()
+        try:
+            cursor = self.collection.find(
+                {'search_keys': search_key, 'last_seen': {'$gte': now - max_age}},
+                {'_id': 0, 'first_seen': 0, 'search_keys': 0, 'skills': 0}
+            ).sort('last_seen', -1).limit(limit)
+            documents = list(cursor)
+        except PyMongoError as e:
+            self._mark_unavailable(e)
+            return [], None
+
+        if not documents:
+            return [], None
+        return [self.from_document(document) for document in documents], now - documents[0]['last_seen']
@@ -0,0 +1,53 @@
+"""
+Rate Limiter
+Description: Async token-bucket rate limiting for per-provider request quotas
+"""
+
+import time
+import asyncio
+import threading
+
+class TokenBucket:
+    """Token-bucket rate limiter: ``rate`` tokens per second, bursts of up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Tokens that could be taken right now"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if the quota allows it, without waiting"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping only as long as the quota requires; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+
+            await asyncio.sleep(delay)
+            waited += delay
@@ -0,0 +1,149 @@
+"""
+Model Registry
+Description: Lazily created, process-wide shared instances of the heavy models and services
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+class ModelRegistry:
+    """Lazily created, process-wide shared instances of heavy models and services
+
+    Each name maps to a zero-argument factory that runs on the first ``get`` and never
+    again, so routes and ChatService share one SentenceTransformer, one ResumeOptimizer
+    and one SalaryPredictor per worker. Factories may ``get`` other names; every name has
+    its own lock, so loading one model never blocks callers of another.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.RLock] = {}
+        self._lock = threading.Lock()
+        self.load_times: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """Register (or replace) the factory for ``name``"""
+        with self._lock:
+            self._factories[name] = factory
+            self._locks.setdefault(name, threading.RLock())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._instances
+
+    def get(self, name: str) -> Any:
+        """Shared instance for ``name``, created on first use"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name not in self._factories:
+                raise KeyError(f"No factory registered for '{name}'")
+            lock = self._locks[name]
+
+        with lock:
+            # Another thread may have finished loading while we waited
+            instance = self._instances.get(name)
+            if instance is None:
+                started = time.perf_counter()
+                instance = self._factories[name]()
+                self.load_times[name] = time.perf_counter() - started
+                self._instances[name] = instance
+                logger.info(f"Loaded shared '{name}' in {self.load_times[name]:.2f}s")
+            return instance
+
+    def set(self, name: str, instance: Any):
+        """Install a ready-made instance, e.g. a stub in a shell session"""
+        with self._lock:
+            self._locks.setdefault(name, threading.RLock())
+            self._instances[name] = instance
+
+    def preload(self, names: List[str]):
+        """Create the named instances now, logging rather than raising on failure"""
+        for name in names:
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.error(f"Failed to preload '{name}': {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'registered': sorted(self._factories),
+            'loaded': sorted(self._instances),
+            'load_seconds': dict(self.load_times)
+        }
+
+registry = ModelRegistry()
+
+def _create_job_matcher():
+    from app.ml_models.job_matcher import RealTimeJobMatcher
+    from app.services.job_store import JobStore
+
+    job_store = None
+    if os.getenv('JOB_PERSISTENCE', '1') == '1':
+        try:
+            job_store = JobStore.from_uri(os.getenv('MONGO_URI', 'mongodb://localhost:27017/career_compass'))
+        except Exception as e:
+            logger.error(f"Job persistence disabled: {e}")
+    return RealTimeJobMatcher(job_store=job_store)
+
+def _create_sync_job_fetcher():
+    from app.ml_models.job_matcher import SyncJobFetcher
+    return SyncJobFetcher(matcher=registry.get('job_matcher'))
+
+def _create_resume_optimizer():
+    from app.ml_models.resume_optimizer import ResumeOptimizer
+    return ResumeOptimizer()
+
+def _create_salary_data_collector():
+    from app.ml_models.salary_predictor import SalaryDataCollector
+    return SalaryDataCollector()
+
+def _create_market_analyzer():
+    from app.ml_models.salary_predictor import MarketAnalyzer
+    return MarketAnalyzer(registry.get('salary_data_collector'))
+
+def _create_salary_predictor():
+    from app.ml_models.salary_predictor import SalaryPredictor
+    return SalaryPredictor(registry.get('salary_data_collector'), registry.get('market_analyzer'))
+
+def _create_cache_warmer():
+    from app.services.cache_warmer import CacheWarmer
+    return CacheWarmer(registry.get('job_matcher'))
+
+def _create_chat_service():
+    from app.services.chat_service import ChatService
+    return ChatService()
+
+registry.register('job_matcher', _create_job_matcher)
+registry.register('sync_job_fetcher', _create_sync_job_fetcher)
+registry.register('resume_optimizer', _create_resume_optimizer)
+registry.register('salary_data_collector', _create_salary_data_collector)
+registry.register('market_analyzer', _create_market_analyzer)
+registry.register('salary_predictor', _create_salary_predictor)
+registry.register('chat_service', _create_chat_service)
+registry.register('cache_warmer', _create_cache_warmer)
+
+def get_job_matcher():
+    return registry.get('job_matcher')
+
+def get_sync_job_fetcher():
+    return registry.get('sync_job_fetcher')
+
+def get_resume_optimizer():
+    return registry.get('resume_optimizer')
+
+def get_market_analyzer():
+    return registry.get('market_analyzer')
+
+def get_salary_predictor():
+    return registry.get('salary_predictor')
+
+def get_chat_service():
+    return registry.get('chat_service')
@@ -2,6 +2,7 @@ import re
 from datetime import datetime
 import json
 from typing import Dict, List
+from app.ml_models.skill_taxonomy import skill_taxonomy
 
 class ResumeBuilder:
     def __init__(self):
@@ -20,6 +21,8 @@ class ResumeBuilder:
                 'cross-cultural communication', 'multi-time zone coordination'
             ]
         }
+        self.technical_skills_mask = skill_taxonomy.mask(self.indian_resume_keywords['technical_skills'])
+        self.keyword_mask = self.technical_skills_mask | skill_taxonomy.mask(self.indian_resume_keywords['soft_skills'])
     
     def validate_user_profile(self, user_profile: Dict) -> List[str]:
         """Validate user profile data and return errors"""
@@ -69,8 +72,7 @@ class ResumeBuilder:
             score += 15
         
         # Check for relevant keywords
-        keyword_count = sum(1 for keyword in self.indian_resume_keywords['technical_skills'] 
-                           if keyword in resume_text.lower())
+        keyword_count = skill_taxonomy.overlap(skill_taxonomy.encode(resume_text), self.technical_skills_mask)
         score += min(keyword_count * 2, 20)  # Max 20 points for keywords
         
         # Check for proper formatting (simple heuristics)
@@ -84,24 +86,19 @@ class ResumeBuilder:
         if not job_description:
             return {'match_percentage': 0, 'matched_keywords': [], 'missing_keywords': []}
         
-        resume_words = set(resume_text.lower().split())
-        job_words = set(job_description.lower().split())
+        # Focus on technical and soft skill keywords, compared as skill bitsets
+        job_skills = skill_taxonomy.encode(job_description) & self.keyword_mask
+        resume_skills = skill_taxonomy.encode(resume_text) & self.keyword_mask
         
-        # Focus on technical keywords
-        all_keywords = (self.indian_resume_keywords['technical_skills'] + 
-                       self.indian_resume_keywords['soft_skills'])
-        
-        job_keywords = [word for word in all_keywords if word in job_description.lower()]
-        matched_keywords = [word for word in job_keywords if word in resume_text.lower()]
-        missing_keywords = [word for word in job_keywords if word not in resume_text.lower()]
-        
-        match_percentage = (len(matched_keywords) / len(job_keywords) * 100) if job_keywords else 0
+        total_job_keywords = job_skills.bit_count()
+        matched = job_skills & resume_skills
+        match_percentage = (matched.bit_count() / total_job_keywords * 100) if total_job_keywords else 0
         
         return {
             'match_percentage': round(match_percentage, 1),
-            'matched_keywords': matched_keywords,
-            'missing_keywords': missing_keywords[:10],  # Top 10 missing keywords
-            'total_job_keywords': len(job_keywords)
+            'matched_keywords': skill_taxonomy.decode(matched),
+            'missing_keywords': skill_taxonomy.decode(job_skills & ~resume_skills)[:10],  # Top 10 missing keywords
+            'total_job_keywords': total_job_keywords
         }
 
     def analyze_sections(self, resume_text):
@@ -266,23 +263,20 @@ class ResumeBuilder:
             'Soft Skills': []
         }
         
-        programming_langs = ['python', 'java', 'javascript', 'c++', 'c#', 'go', 'rust', 'scala']
-        frameworks = ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'express']
-        databases = ['mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 'oracle']
-        tools = ['git', 'docker', 'kubernetes', 'jenkins', 'aws', 'gcp', 'azure']
+        # Taxonomy categories, checked in this order, and the section they go under
+        sections = [
+            ('programming', 'Programming Languages'),
+            ('web_development', 'Frameworks & Libraries'),
+            ('data_science', 'Frameworks & Libraries'),
+            ('databases', 'Databases'),
+            ('cloud_devops', 'Tools & Technologies')
+        ]
         
         for skill in skills:
-            skill_lower = skill.lower()
-            if any(lang in skill_lower for lang in programming_langs):
-                categories['Programming Languages'].append(skill)
-            elif any(fw in skill_lower for fw in frameworks):
-                categories['Frameworks & Libraries'].append(skill)
-            elif any(db in skill_lower for db in databases):
-                categories['Databases'].append(skill)
-            elif any(tool in skill_lower for tool in tools):
-                categories['Tools & Technologies'].append(skill)
-            else:
-                categories['Soft Skills'].append(skill)
+            skill_bits = skill_taxonomy.encode(skill)
+            section = next((name for category, name in sections
+                            if skill_bits & skill_taxonomy.category_mask(category)), 'Soft Skills')
+            categories[section].append(skill)
         
         return {k: v for k, v in categories.items() if v}  # Remove empty categories
 
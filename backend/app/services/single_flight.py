@@ -0,0 +1,56 @@
+"""
+Single Flight
+Description: Coalesces concurrent identical async calls into one in-flight task
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight task
+
+    The first caller for a key starts the work; callers arriving while it is running
+    await the same task. Each waiter is shielded, so one caller timing out or being
+    cancelled does not cancel the shared work for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def start(self, key: Hashable, coro_factory: Callable[[], Awaitable]) -> asyncio.Task:
+        """Return the task in flight for ``key``, starting one if there is none"""
+        task = self._inflight.get(key)
+
+        # A task bound to another event loop cannot be awaited from this one
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+            return task
+
+        task = asyncio.ensure_future(coro_factory())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        self.started += 1
+        return task
+
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable]) -> Any:
+        """Run ``coro_factory()`` once per key among concurrent callers and share the result"""
+        return await asyncio.shield(self.start(key, coro_factory))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'in_flight': len(self._inflight),
+            'started': self.started,
+            'coalesced': self.coalesced
+        }
@@ -0,0 +1,200 @@
+"""
+End-to-End Fetch Benchmark
+Description: Drives JobAPIClient and RealTimeJobMatcher against the local provider stand-in and reports latency percentiles
+
+Usage (from ``backend/``):
+
+    python -m benchmarks.fetch_benchmark --requests 200 --concurrency 20
+    python -m benchmarks.fetch_benchmark --provider jsearch:latency_ms=3000 --deadline 1
+    python -m benchmarks.fetch_benchmark --mode recommend --cold
+
+Record the stand-in's (or live providers') responses once, then replay them offline
+with the same or simulated latency for reproducible runs:
+
+    python -m benchmarks.fetch_benchmark --mode both --record benchmarks/cassettes/default.json.gz
+    python -m benchmarks.fetch_benchmark --mode both --replay benchmarks/cassettes/default.json.gz --replay-latency-ms 200
+"""
+
+import sys
+import time
+import json
+import asyncio
+import argparse
+import logging
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.ml_models.job_matcher import JobAPIClient, RealTimeJobMatcher
+from app.services.cassette import Cassette
+from benchmarks.provider_stub import PROVIDERS, add_stub_arguments, start_stub_server, stub_config_from_args
+
+QUERIES = [
+    ('python developer', 'bangalore'), ('data scientist', 'mumbai'), ('java developer', 'pune'),
+    ('react developer', 'hyderabad'), ('devops engineer', 'chennai'), ('machine learning', 'delhi'),
+    ('product manager', 'gurgaon'), ('full stack developer', 'noida')
+]
+
+PROFILES = [
+    {'skills': 'python, django, aws', 'preferred_roles': 'python developer', 'location': 'bangalore',
+     'experience_years': 3, 'expected_salary': 1200000},
+    {'skills': 'machine learning, tensorflow, sql', 'preferred_roles': 'data scientist', 'location': 'mumbai',
+     'experience_years': 5, 'expected_salary': 2000000},
+    {'skills': 'react, typescript, node.js', 'preferred_roles': 'react developer', 'location': 'hyderabad',
+     'experience_years': 1, 'expected_salary': 600000}
+]
+
+STUB_KEYS = {
+    'adzuna_app_id': 'stub', 'adzuna_app_key': 'stub',
+    'rapidapi_key': 'stub', 'jooble_api_key': 'stub'
+}
+
+def summarize(latencies: List[float], failures: int, wall_seconds: float) -> Dict[str, float]:
+    values = np.asarray(latencies) * 1000 if latencies else np.zeros(1)
+    return {
+        'requests': len(latencies) + failures,
+        'failures': failures,
+        'throughput_rps': round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0,
+        'p50_ms': round(float(np.percentile(values, 50)), 2),
+        'p95_ms': round(float(np.percentile(values, 95)), 2),
+        'p99_ms': round(float(np.percentile(values, 99)), 2),
+        'max_ms': round(float(values.max()), 2)
+    }
+
+async def run_load(call, n_requests: int, concurrency: int) -> Dict[str, float]:
+    """Run ``call(i)`` n_requests times with at most ``concurrency`` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, failures = [], 0
+
+    async def one(i: int):
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await call(i)
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Benchmark request failed: {e}")
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n_requests)))
+    return summarize(latencies, failures, time.perf_counter() - started)
+
+def build_client(base_urls: Dict[str, str], args: argparse.Namespace,
+                 cassette: Optional[Cassette] = None) -> JobAPIClient:
+    # Unlimited quotas unless the run is meant to measure throttling
+    rate_limits = None if args.respect_rate_limits else {
+        provider: (1e9, 1e9) for provider in ('adzuna', 'jsearch', 'jooble')
+    }
+    client = JobAPIClient(api_keys=STUB_KEYS, rate_limits=rate_limits)
+    client.base_urls = base_urls
+    client.use_cassette(cassette)
+    if args.deadline is not None:
+        client.fetch_deadline = args.deadline
+    if args.hedge is not None:
+        client.hedge_after = args.hedge
+    return client
+
+async def benchmark(args: argparse.Namespace) -> Dict:
+    results = {'config': {key: value for key, value in vars(args).items() if key != 'json'}}
+    stub, runner, cassette = None, None, None
+    if args.replay:
+        # No server: cassette keys ignore host and port, so the stand-in's paths are enough
+        cassette = Cassette(args.replay, mode=Cassette.REPLAY, latency_ms=args.replay_latency_ms,
+                            jitter_ms=args.replay_jitter_ms, latency_scale=args.replay_latency_scale)
+        base_urls = {provider: f"http://127.0.0.1/{provider}" for provider in PROVIDERS}
+    else:
+        stub, runner, base_urls = await start_stub_server(stub_config_from_args(args))
+        if args.record:
+            cassette = Cassette(args.record, mode=Cassette.RECORD)
+
+    try:
+        if args.mode in ('fetch', 'both'):
+            client = build_client(base_urls, args, cassette)
+            results['fetch_all_jobs_async'] = await run_load(
+                lambda i: client.fetch_all_jobs_async(*QUERIES[i % len(QUERIES)]),
+                args.requests, args.concurrency
+            )
+            results['provider_health'] = client.get_provider_health()
+            await client.close()
+
+        if args.mode in ('recommend', 'both'):
+            matcher = RealTimeJobMatcher(api_keys=STUB_KEYS)
+            matcher.api_client = build_client(base_urls, args, cassette)
+            results['recommend_jobs_async'] = await run_load(
+                lambda i: matcher.recommend_jobs_async(PROFILES[i % len(PROFILES)], refresh_cache=args.cold),
+                args.requests, args.concurrency
+            )
+            results['cache_stats'] = matcher.get_cache_stats()
+            await matcher.api_client.close()
+
+        if stub is not None:
+            results['stub_requests'] = dict(stub.requests)
+            results['stub_errors'] = dict(stub.errors)
+        if cassette is not None:
+            cassette.save()
+            results['cassette'] = cassette.stats()
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+    return results
+
+def print_report(results: Dict):
+    for name in ('fetch_all_jobs_async', 'recommend_jobs_async'):
+        if name not in results:
+            continue
+        stats = results[name]
+        print(f"\n{name}")
+        print(f"  requests    {stats['requests']} ({stats['failures']} failed)")
+        print(f"  throughput  {stats['throughput_rps']} req/s")
+        print(f"  latency     p50 {stats['p50_ms']} ms | p95 {stats['p95_ms']} ms | "
+              f"p99 {stats['p99_ms']} ms | max {stats['max_ms']} ms")
+    if 'stub_requests' in results:
+        print(f"\nstub requests {results['stub_requests']}, errors {results['stub_errors']}")
+    if 'cassette' in results:
+        cassette = results['cassette']
+        print(f"\ncassette {cassette['mode']} {cassette['path']}: {cassette['requests']} requests, "
+              f"{cassette['recorded']} recorded, {cassette['hits']} replayed, {cassette['misses']} missed")
+    batcher = results.get('cache_stats', {}).get('embedding_batcher')
+    if batcher:
+        print(f"embedding batches {batcher['batches']} for {batcher['requests']} encode calls, "
+              f"sizes p50 {batcher['batch_size_p50']} | p95 {batcher['batch_size_p95']} "
+              f"{batcher['batch_size_histogram']}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark job fetching against local stand-in providers')
+    parser.add_argument('--mode', choices=['fetch', 'recommend', 'both'], default='fetch')
+    parser.add_argument('--requests', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--deadline', type=float, default=None, help='override JOB_FETCH_DEADLINE_SECONDS')
+    parser.add_argument('--hedge', type=float, default=None, help='override JOB_FETCH_HEDGE_SECONDS')
+    parser.add_argument('--cold', action='store_true', help='bypass the job cache on every recommendation')
+    parser.add_argument('--respect-rate-limits', action='store_true', help='keep the per-provider quotas')
+    parser.add_argument('--json', action='store_true', help='print the raw results as JSON')
+    parser.add_argument('--verbose', action='store_true', help='show application logging')
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument('--record', metavar='PATH', help='record provider responses to a cassette')
+    cassette_group.add_argument('--replay', metavar='PATH', help='replay a cassette instead of running the stand-in')
+    parser.add_argument('--replay-latency-ms', type=float, default=None,
+                        help='simulated latency per replayed response (default: the recorded latency)')
+    parser.add_argument('--replay-jitter-ms', type=float, default=0.0)
+    parser.add_argument('--replay-latency-scale', type=float, default=1.0,
+                        help='multiplier on recorded latencies when --replay-latency-ms is not set')
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    # The app modules log every fetch at INFO; keep the report readable
+    logging.getLogger('app').setLevel(logging.INFO if args.verbose else logging.ERROR)
+    results = asyncio.run(benchmark(args))
+    if args.json:
+        print(json.dumps(results, indent=2, default=str))
+    else:
+        print_report(results)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+"""
+Local Job Provider Stand-in
+Description: aiohttp server answering Adzuna, JSearch and Jooble-shaped requests with configurable latency and errors
+
+Run standalone with ``python -m benchmarks.provider_stub --port 8099`` from ``backend/``
+and point the client at it:
+
+    ADZUNA_API_URL=http://127.0.0.1:8099/adzuna
+    JSEARCH_API_URL=http://127.0.0.1:8099/jsearch
+    JOOBLE_API_URL=http://127.0.0.1:8099/jooble
+"""
+
+import random
+import asyncio
+import argparse
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from aiohttp import web
+
+PROVIDERS = ('adzuna', 'jsearch', 'jooble')
+
+TITLES = ['Software Engineer', 'Data Scientist', 'Backend Developer', 'Frontend Developer',
+          'DevOps Engineer', 'Machine Learning Engineer', 'Full Stack Developer', 'QA Engineer',
+          'Product Manager', 'Data Analyst', 'Cloud Architect', 'Android Developer']
+LEVELS = ['Junior', '', 'Senior', 'Lead', 'Principal']
+COMPANIES = ['Infosys', 'TCS', 'Wipro', 'Flipkart', 'Swiggy', 'Zomato', 'Razorpay', 'Freshworks',
+             'Zoho', 'PhonePe', 'Paytm', 'HCL', 'Accenture', 'Myntra', 'CRED', 'Ola']
+LOCATIONS = ['Bangalore', 'Mumbai', 'Pune', 'Hyderabad', 'Chennai', 'Delhi', 'Gurgaon', 'Noida']
+SKILLS = ['python', 'java', 'react', 'aws', 'docker', 'kubernetes', 'sql', 'mongodb', 'spark',
+          'tensorflow', 'django', 'flask', 'node.js', 'typescript', 'git', 'linux']
+CONTRACT_TYPES = ['full_time', 'contract', 'part_time', 'FULLTIME', 'INTERN']
+
+@dataclass
+class ProviderBehaviour:
+    """How one stand-in provider responds"""
+    latency_ms: float = 150.0
+    jitter_ms: float = 50.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    results_per_page: int = 20
+    max_pages: int = 3
+
+@dataclass
+class StubConfig:
+    default: ProviderBehaviour = field(default_factory=ProviderBehaviour)
+    overrides: Dict[str, ProviderBehaviour] = field(default_factory=dict)
+    seed: int = 7
+    # Share of postings every provider lists (same job, provider-specific id and URL)
+    overlap_rate: float = 0.2
+
+    def behaviour(self, provider: str) -> ProviderBehaviour:
+        return self.overrides.get(provider, self.default)
+
+def _seeded(seed: str) -> random.Random:
+    return random.Random(zlib.crc32(seed.encode('utf-8')))
+
+def _fake_jobs(provider: str, query: str, location: str, page: int, count: int,
+               overlap_rate: float = 0.0) -> List[Dict]:
+    """Deterministic postings for a (provider, query, location, page)
+
+    Each result slot is, with probability ``overlap_rate``, a posting shared by every
+    provider for the same query (as real boards syndicate the same job); otherwise it is
+    unique to this provider.
+    """
+    jobs = []
+    for index in range(count):
+        slot = f"{query}|{location}|{page}|{index}"
+        shared = _seeded(slot).random() < overlap_rate
+        rng = _seeded(slot if shared else f"{provider}|{slot}")
+        title = f"{rng.choice(LEVELS)} {rng.choice(TITLES)}".strip()
+        skills = rng.sample(SKILLS, 5)
+        salary_min = rng.randrange(300000, 3000000, 50000)
+        jobs.append({
+            'id': f"{provider}-{page}-{index}-{rng.randrange(10 ** 6)}",
+            'title': title,
+            'company': rng.choice(COMPANIES),
+            'location': location or rng.choice(LOCATIONS),
+            'description': (f"We are hiring a {title} with {rng.randint(0, 10)}+ years of experience "
+                            f"in {', '.join(skills)}. {query} experience is a plus."),
+            'salary_min': salary_min,
+            'salary_max': salary_min + rng.randrange(100000, 1500000, 50000),
+            'contract_type': rng.choice(CONTRACT_TYPES),
+            'created': '2024-01-15T10:00:00Z',
+            'url': f"https://example.com/{provider}/{page}/{index}"
+        })
+    return jobs
+
+def _adzuna_body(jobs: List[Dict]) -> Dict:
+    return {'results': [{
+        'id': job['id'], 'title': job['title'],
+        'company': {'display_name': job['company']},
+        'location': {'display_name': job['location']},
+        'description': job['description'],
+        'salary_min': job['salary_min'], 'salary_max': job['salary_max'],
+        'redirect_url': job['url'], 'created': job['created'],
+        'contract_type': job['contract_type'],
+        'category': {'label': 'IT Jobs'}
+    } for job in jobs]}
+
+def _jsearch_body(jobs: List[Dict]) -> Dict:
+    return {'status': 'OK', 'data': [{
+        'job_id': job['id'], 'job_title': job['title'],
+        'employer_name': job['company'], 'job_location': job['location'],
+        'job_description': job['description'],
+        'job_min_salary': job['salary_min'], 'job_max_salary': job['salary_max'],
+        'job_apply_link': job['url'], 'job_posted_at_datetime_utc': job['created'],
+        'job_employment_type': job['contract_type'], 'job_job_title': job['title']
+    } for job in jobs]}
+
+def _jooble_body(jobs: List[Dict]) -> Dict:
+    return {'totalCount': len(jobs), 'jobs': [{
+        'id': job['id'], 'title': job['title'], 'company': job['company'],
+        'location': job['location'], 'snippet': job['description'],
+        'salary': f"₹{job['salary_min']:,}", 'link': job['url'],
+        'updated': job['created'], 'type': job['contract_type']
+    } for job in jobs]}
+
+class ProviderStub:
+    """The stand-in application plus per-provider request counters"""
+
+    def __init__(self, config: Optional[StubConfig] = None):
+        self.config = config or StubConfig()
+        self.rng = random.Random(self.config.seed)
+        self.requests = {provider: 0 for provider in PROVIDERS}
+        self.errors = {provider: 0 for provider in PROVIDERS}
+
+    async def _respond(self, provider: str, query: str, location: str, page: int, render) -> web.Response:
+        self.requests[provider] += 1
+        behaviour = self.config.behaviour(provider)
+
+        latency = max(0.0, self.rng.gauss(behaviour.latency_ms, behaviour.jitter_ms)) / 1000
+        await asyncio.sleep(latency)
+
+        roll = self.rng.random()
+        if roll < behaviour.error_rate:
+            self.errors[provider] += 1
+            return web.json_response({'error': 'stub upstream failure'}, status=503)
+        if roll < behaviour.error_rate + behaviour.rate_limit_rate:
+            self.errors[provider] += 1
+            return web.json_response({'error': 'rate limited'}, status=429, headers={'Retry-After': '1'})
+
+        count = behaviour.results_per_page if page <= behaviour.max_pages else 0
+        return web.json_response(render(_fake_jobs(provider, query, location, page, count,
+                                                   self.config.overlap_rate)))
+
+    async def adzuna(self, request: web.Request) -> web.Response:
+        page = int(request.match_info.get('page', 1))
+        return await self._respond('adzuna', request.query.get('what', ''),
+                                   request.query.get('where', ''), page, _adzuna_body)
+
+    async def jsearch(self, request: web.Request) -> web.Response:
+        query = request.query.get('query', '')
+        keywords, _, location = query.partition(' in ')
+        return await self._respond('jsearch', keywords, location,
+                                   int(request.query.get('page', 1)), _jsearch_body)
+
+    async def jooble(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        return await self._respond('jooble', payload.get('keywords', ''), payload.get('location', ''),
+                                   int(payload.get('page', 1)), _jooble_body)
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/adzuna/{country}/search/{page}', self.adzuna)
+        app.router.add_get('/jsearch/search', self.jsearch)
+        app.router.add_post('/jooble/{api_key}', self.jooble)
+        return app
+
+    def base_urls(self, host: str, port: int) -> Dict[str, str]:
+        return {provider: f"http://{host}:{port}/{provider}" for provider in PROVIDERS}
+
+async def start_stub_server(config: Optional[StubConfig] = None, host: str = '127.0.0.1',
+                            port: int = 0):
+    """Start the stand-in on the running loop; returns (stub, runner, base_urls)"""
+    stub = ProviderStub(config)
+    runner = web.AppRunner(stub.make_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+
+    # Port 0 lets the OS pick a free port
+    bound_port = runner.addresses[0][1]
+    return stub, runner, stub.base_urls(host, bound_port)
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--latency-ms', type=float, default=150.0, help='mean provider latency')
+    parser.add_argument('--jitter-ms', type=float, default=50.0, help='latency standard deviation')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of 503 responses')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='fraction of 429 responses')
+    parser.add_argument('--results', type=int, default=20, help='results per page')
+    parser.add_argument('--pages', type=int, default=3, help='pages available per query')
+    parser.add_argument('--provider', action='append', default=[], metavar='NAME:KEY=VALUE,...',
+                        help="per-provider override, e.g. 'jsearch:latency_ms=2000,error_rate=0.2'")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--overlap-rate', type=float, default=0.2,
+                        help='fraction of postings listed by every provider')
+
+def stub_config_from_args(args: argparse.Namespace) -> StubConfig:
+    default = ProviderBehaviour(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, results_per_page=args.results, max_pages=args.pages
+    )
+    overrides = {}
+    for spec in args.provider:
+        name, _, settings = spec.partition(':')
+        if name not in PROVIDERS:
+            raise ValueError(f"Unknown provider '{name}'; expected one of {PROVIDERS}")
+        values = dict(vars(default))
+        for setting in filter(None, settings.split(',')):
+            key, _, value = setting.partition('=')
+            if key not in values:
+                raise ValueError(f"Unknown provider setting '{key}'")
+            values[key] = type(values[key])(value)
+        overrides[name] = ProviderBehaviour(**values)
+    return StubConfig(default=default, overrides=overrides, seed=args.seed, overlap_rate=args.overlap_rate)
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve stand-in job provider APIs')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    stub = ProviderStub(stub_config_from_args(args))
+    for provider, url in stub.base_urls(args.host, args.port).items():
+        print(f"{provider.upper()}_API_URL={url}")
+    web.run_app(stub.make_app(), host=args.host, port=args.port, access_log=None)
+
+if __name__ == '__main__':
+    main()